@@ -22,8 +22,14 @@ from .models import (
     APIResponse,
 )
 
+try:
+    from .async_client import AsyncGENUSDClient
+except ImportError:  # aiohttp is optional
+    AsyncGENUSDClient = None
+
 __all__ = [
     "GENUSDClient",
+    "AsyncGENUSDClient",
     "create_client",
     "UTXO",
     "MintRequest",
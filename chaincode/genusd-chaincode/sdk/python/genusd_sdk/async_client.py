@@ -0,0 +1,168 @@
+"""
+GENUSD SDK Async Client - asyncio Implementation
+
+Provides a concurrent interface for GENUSD stablecoin operations backed by
+aiohttp. Requests are signed and serialized exactly like GENUSDClient.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from .client import _GENUSDClientBase, _json_loads, _request_body
+from .models import (
+    MintRequest,
+    TransferRequest,
+    BurnRequest,
+    APIResponse,
+)
+
+
+class AsyncGENUSDClient(_GENUSDClientBase):
+    """
+    Asynchronous GENUSD SDK Client for Python
+
+    Must be used as an async context manager so the underlying connection
+    pool is opened and closed deterministically.
+
+    Args:
+        api_url: Base URL of the GENUSD API
+        api_key: Optional API key for authentication
+        timeout: Request timeout in seconds (default: 30)
+        enable_mock_signatures: Use mock Dilithium signatures for testing (default: False)
+        connection_limit: Max open connections in the pool (default: 100)
+        rate_limit: Max requests in flight at once (default: 32)
+
+    Example:
+        >>> async with AsyncGENUSDClient(
+        ...     api_url="http://localhost:3000/api/v1",
+        ...     enable_mock_signatures=True
+        ... ) as client:
+        ...     results = await client.bulk_mint(requests)
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        enable_mock_signatures: bool = False,
+        connection_limit: int = 100,
+        rate_limit: int = 32,
+    ):
+        super().__init__(api_url, api_key, timeout, enable_mock_signatures)
+        self.connection_limit = connection_limit
+        self.rate_limit = rate_limit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncGENUSDClient":
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+
+        # Created here rather than in __init__: before Python 3.10 a
+        # Semaphore binds to the event loop current at construction
+        self._semaphore = asyncio.Semaphore(self.rate_limit)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=60,
+            ),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying connection pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> APIResponse:
+        """Make HTTP request to API (``data`` may be a pre-serialized body)"""
+        if self._session is None:
+            raise RuntimeError("AsyncGENUSDClient must be used with 'async with'")
+
+        url = f"{self.api_url}{endpoint}"
+
+        async with self._semaphore:
+            try:
+                async with self._session.request(
+                    method,
+                    url,
+                    data=_request_body(data),
+                    params=params,
+                    headers=headers,
+                ) as response:
+                    content = await response.read()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return APIResponse(success=False, error=str(e) or type(e).__name__)
+
+        try:
+            result = _json_loads(content)
+        except ValueError as e:
+            # Error pages from proxies are often not JSON
+            return APIResponse(success=False, error=f"HTTP {status}" if status >= 400 else str(e))
+
+        if status >= 400:
+            return APIResponse(
+                success=False,
+                error=result.get("error", f"HTTP {status}"),
+            )
+
+        return APIResponse.from_dict(result)
+
+    async def mint(self, request: MintRequest) -> APIResponse:
+        """Mint new stablecoins (issuer only)"""
+        data, headers = self._build_mint(request)
+        return await self._request("POST", "/mint", data=data, headers=headers)
+
+    async def transfer(self, request: TransferRequest) -> APIResponse:
+        """Transfer stablecoins between users"""
+        data, headers = self._build_transfer(request)
+        return await self._request("POST", "/transfer", data=data, headers=headers)
+
+    async def burn(self, request: BurnRequest) -> APIResponse:
+        """Burn stablecoins (destroy tokens)"""
+        data, headers = self._build_burn(request)
+        return await self._request("POST", "/burn", data=data, headers=headers)
+
+    async def get_utxo(self, utxo_id: str) -> APIResponse:
+        """Get UTXO by ID"""
+        return await self._request("GET", f"/utxo/{utxo_id}")
+
+    async def get_balance(self, user_id: str) -> APIResponse:
+        """Get user balance (sum of active UTXOs)"""
+        return await self._request("GET", f"/balance/{user_id}")
+
+    async def bulk_mint(self, requests: List[MintRequest]) -> List[APIResponse]:
+        """
+        Submit many mint requests concurrently
+
+        At most ``rate_limit`` requests are in flight at once. Results are
+        returned in the same order as ``requests``.
+        """
+        return await asyncio.gather(*(self.mint(r) for r in requests))
+
+    async def bulk_transfer(self, requests: List[TransferRequest]) -> List[APIResponse]:
+        """
+        Submit many transfer requests concurrently
+
+        At most ``rate_limit`` requests are in flight at once. Results are
+        returned in the same order as ``requests``.
+        """
+        return await asyncio.gather(*(self.transfer(r) for r in requests))
@@ -7,10 +7,17 @@ Provides high-level interface for GENUSD stablecoin operations.
 import hashlib
 import json
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .models import (
     UTXO,
@@ -23,24 +30,60 @@ from .models import (
 )
 
 
-class GENUSDClient:
+MOCK_SIGNATURE_PREFIX = "MOCK_DILITHIUM_SIG_"
+
+
+def _json_bytes(obj: Any) -> bytes:
     """
-    GENUSD SDK Client for Python
-    
-    Provides methods to interact with GENUSD stablecoin chaincode via REST API.
+    Compact ASCII JSON encoding (same layout as JSON.stringify in the JS SDK)
+
+    Non-ASCII text is \\u-escaped: the signed message travels in the
+    X-Dilithium-Signature header, which must stay latin-1 encodable. orjson
+    has no escaping option, so such payloads fall back to the json module.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj)
+        if data.isascii():
+            return data
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _request_body(data: Any) -> Optional[bytes]:
+    """Encode a request body unless a builder already serialized it"""
+    if data is None or isinstance(data, bytes):
+        return data
+    return _json_bytes(data)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _append_signature(payload: bytes, signature: str) -> bytes:
+    """
+    Close a serialized JSON object with its dilithium_signature field
     
-    Args:
-        api_url: Base URL of the GENUSD API
-        api_key: Optional API key for authentication
-        timeout: Request timeout in seconds (default: 30)
-        enable_mock_signatures: Use mock Dilithium signatures for testing (default: False)
+    The signed message and the POST body share every other field, so the
+    payload is encoded once and spliced rather than re-serialized.
+    """
+    return payload[:-1] + b',"dilithium_signature":' + _json_bytes(signature) + b"}"
+
+
+@lru_cache(maxsize=4096)
+def _mock_signature(message: bytes) -> str:
+    """Deterministic mock Dilithium signature, memoized for repeated messages"""
+    return MOCK_SIGNATURE_PREFIX + hashlib.sha256(message).hexdigest()[:32]
+
+
+class _GENUSDClientBase:
+    """
+    Shared signing and payload construction for the sync and async clients.
     
-    Example:
-        >>> client = GENUSDClient(
-        ...     api_url="http://localhost:3000/api/v1",
-        ...     enable_mock_signatures=True
-        ... )
-        >>> result = client.get_balance("user_alice")
+    Builders return ``(body, headers)`` with the body already serialized, so
+    both transports sign and send byte-identical requests.
     """
     
     def __init__(
@@ -54,66 +97,173 @@ class GENUSDClient:
         self.api_key = api_key
         self.timeout = timeout
         self.enable_mock_signatures = enable_mock_signatures
-        
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
-        if api_key:
-            self.session.headers.update({"X-API-Key": api_key})
     
-    def _generate_mock_signature(self, message: str) -> str:
+    def _generate_mock_signature(self, message: bytes) -> str:
         """Generate mock Dilithium signature for testing"""
         if not self.enable_mock_signatures:
             raise ValueError("Mock signatures disabled. Use real Dilithium signing.")
         
-        hash_digest = hashlib.sha256(message.encode()).hexdigest()
-        return f"MOCK_DILITHIUM_SIG_{hash_digest[:32]}"
+        return _mock_signature(message)
     
-    def _create_signature_headers(self, message: str, signer_id: str) -> Dict[str, str]:
+    def _create_signature_headers(self, message: bytes, signer_id: str) -> Dict[str, str]:
         """Create Dilithium signature headers for API request"""
-        timestamp = int(time.time() * 1000)
         signature = (
             self._generate_mock_signature(message)
             if self.enable_mock_signatures
-            else message  # In production, use real Dilithium library
+            else message.decode()  # In production, use real Dilithium library
         )
         
+        # Static headers (Content-Type, X-API-Key) live on the session;
+        # only the per-request signature fields are built here.
         return {
             "X-Dilithium-Signature": signature,
             "X-Dilithium-Signer": signer_id,
-            "X-Timestamp": str(timestamp),
+            "X-Timestamp": str(time.time_ns() // 1_000_000),
         }
     
+    def _build_mint(self, request: MintRequest) -> Tuple[bytes, Dict[str, str]]:
+        """Build signed POST body and headers for /mint"""
+        payload = _json_bytes({
+            "outputs": [utxo.to_dict() for utxo in request.outputs],
+            "issuer_id": request.issuer_id,
+        })
+        message = b'{"action":"mint",' + payload[1:]
+        
+        headers = self._create_signature_headers(message, request.issuer_id)
+        signature = request.dilithium_signature or headers["X-Dilithium-Signature"]
+        
+        return _append_signature(payload, signature), headers
+    
+    def _build_transfer(self, request: TransferRequest) -> Tuple[bytes, Dict[str, str]]:
+        """Build signed POST body and headers for /transfer"""
+        payload = _json_bytes({
+            "inputs": request.inputs,
+            "outputs": [utxo.to_dict() for utxo in request.outputs],
+            "sender_id": request.sender_id,
+        })
+        message = b'{"action":"transfer",' + payload[1:]
+        
+        headers = self._create_signature_headers(message, request.sender_id)
+        signature = request.dilithium_signature or headers["X-Dilithium-Signature"]
+        
+        return _append_signature(payload, signature), headers
+    
+    def _build_burn(self, request: BurnRequest) -> Tuple[bytes, Dict[str, str]]:
+        """Build signed POST body and headers for /burn"""
+        payload = _json_bytes({
+            "inputs": request.inputs,
+            "burner_id": request.burner_id,
+        })
+        message = b'{"action":"burn",' + payload[1:]
+        
+        headers = self._create_signature_headers(message, request.burner_id)
+        signature = request.dilithium_signature or headers["X-Dilithium-Signature"]
+        
+        return _append_signature(payload, signature), headers
+    
+    def _build_governance(self, request: GovernanceRequest) -> Tuple[bytes, Dict[str, str]]:
+        """Build signed POST body and headers for /policy/{action}"""
+        payload = request.to_dict()
+        message = _json_bytes(payload)
+        headers = self._create_signature_headers(message, request.admin_id)
+        
+        # to_dict() already carries dilithium_signature, so replace it in
+        # place instead of splicing a second copy onto the message
+        data = _json_bytes({
+            **payload,
+            "dilithium_signature": request.dilithium_signature or headers["X-Dilithium-Signature"],
+        })
+        
+        return data, headers
+
+
+class GENUSDClient(_GENUSDClientBase):
+    """
+    GENUSD SDK Client for Python
+    
+    Provides methods to interact with GENUSD stablecoin chaincode via REST API.
+    
+    Args:
+        api_url: Base URL of the GENUSD API
+        api_key: Optional API key for authentication
+        timeout: Request timeout in seconds (default: 30)
+        enable_mock_signatures: Use mock Dilithium signatures for testing (default: False)
+        pool_maxsize: Max keep-alive connections per host (default: 64)
+        max_retries: Retries for connection errors and 502/503/504 (default: 3)
+    
+    Example:
+        >>> client = GENUSDClient(
+        ...     api_url="http://localhost:3000/api/v1",
+        ...     enable_mock_signatures=True
+        ... )
+        >>> result = client.get_balance("user_alice")
+    """
+    
+    def __init__(
+        self,
+        api_url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        enable_mock_signatures: bool = False,
+        pool_maxsize: int = 64,
+        max_retries: int = 3,
+    ):
+        super().__init__(api_url, api_key, timeout, enable_mock_signatures)
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        if api_key:
+            self.session.headers.update({"X-API-Key": api_key})
+    
     def _request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict] = None,
+        data: Optional[Any] = None,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
     ) -> APIResponse:
-        """Make HTTP request to API"""
+        """Make HTTP request to API (``data`` may be a pre-serialized body)"""
         url = f"{self.api_url}{endpoint}"
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=_request_body(data),
                 params=params,
-                headers=headers or {},
+                headers=headers,
                 timeout=self.timeout,
             )
             
+            try:
+                result = _json_loads(response.content)
+            except ValueError:
+                # Error pages from proxies are often not JSON
+                if response.status_code >= 400:
+                    return APIResponse(success=False, error=f"HTTP {response.status_code}")
+                raise
+            
             if response.status_code >= 400:
                 return APIResponse(
                     success=False,
-                    error=response.json().get("error", f"HTTP {response.status_code}"),
+                    error=result.get("error", f"HTTP {response.status_code}"),
                 )
             
-            result = response.json()
-            return APIResponse(**result)
+            return APIResponse.from_dict(result)
         
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             return APIResponse(success=False, error=str(e))
     
     def mint(self, request: MintRequest) -> APIResponse:
@@ -134,20 +284,7 @@ class GENUSDClient:
             ... )
             >>> result = client.mint(request)
         """
-        message = json.dumps({
-            "action": "mint",
-            "outputs": [asdict(utxo) for utxo in request.outputs],
-            "issuer_id": request.issuer_id,
-        })
-        
-        headers = self._create_signature_headers(message, request.issuer_id)
-        
-        data = {
-            "outputs": [asdict(utxo) for utxo in request.outputs],
-            "issuer_id": request.issuer_id,
-            "dilithium_signature": request.dilithium_signature or headers["X-Dilithium-Signature"],
-        }
-        
+        data, headers = self._build_mint(request)
         return self._request("POST", "/mint", data=data, headers=headers)
     
     def transfer(self, request: TransferRequest) -> APIResponse:
@@ -169,23 +306,35 @@ class GENUSDClient:
             ... )
             >>> result = client.transfer(request)
         """
-        message = json.dumps({
-            "action": "transfer",
-            "inputs": request.inputs,
-            "outputs": [asdict(utxo) for utxo in request.outputs],
-            "sender_id": request.sender_id,
-        })
+        data, headers = self._build_transfer(request)
+        return self._request("POST", "/transfer", data=data, headers=headers)
+    
+    def bulk_transfer(
+        self,
+        transfers: List[TransferRequest],
+        max_inflight: int = 16,
+    ) -> List[APIResponse]:
+        """
+        Submit many transfers with up to ``max_inflight`` in flight at once
         
-        headers = self._create_signature_headers(message, request.sender_id)
+        Requests are signed up front, then sent over the session's keep-alive
+        pool so round-trips overlap instead of running back to back.
         
-        data = {
-            "inputs": request.inputs,
-            "outputs": [asdict(utxo) for utxo in request.outputs],
-            "sender_id": request.sender_id,
-            "dilithium_signature": request.dilithium_signature or headers["X-Dilithium-Signature"],
-        }
+        Args:
+            transfers: TransferRequests to submit
+            max_inflight: Maximum concurrent requests (default: 16)
         
-        return self._request("POST", "/transfer", data=data, headers=headers)
+        Returns:
+            List of APIResponse in the same order as ``transfers``
+        """
+        payloads = [self._build_transfer(request) for request in transfers]
+        
+        def send(payload: Tuple[bytes, Dict[str, str]]) -> APIResponse:
+            data, headers = payload
+            return self._request("POST", "/transfer", data=data, headers=headers)
+        
+        with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+            return list(executor.map(send, payloads))
     
     def burn(self, request: BurnRequest) -> APIResponse:
         """
@@ -197,20 +346,7 @@ class GENUSDClient:
         Returns:
             APIResponse with burned amount
         """
-        message = json.dumps({
-            "action": "burn",
-            "inputs": request.inputs,
-            "burner_id": request.burner_id,
-        })
-        
-        headers = self._create_signature_headers(message, request.burner_id)
-        
-        data = {
-            "inputs": request.inputs,
-            "burner_id": request.burner_id,
-            "dilithium_signature": request.dilithium_signature or headers["X-Dilithium-Signature"],
-        }
-        
+        data, headers = self._build_burn(request)
         return self._request("POST", "/burn", data=data, headers=headers)
     
     def get_utxo(self, utxo_id: str) -> APIResponse:
@@ -231,20 +367,12 @@ class GENUSDClient:
         Returns:
             APIResponse indicating success/failure
         """
-        endpoint = f"/policy/{request.action}"
-        message = json.dumps(asdict(request))
-        headers = self._create_signature_headers(message, request.admin_id)
-        
-        data = {
-            **asdict(request),
-            "dilithium_signature": request.dilithium_signature or headers["X-Dilithium-Signature"],
-        }
-        
-        return self._request("POST", endpoint, data=data, headers=headers)
+        data, headers = self._build_governance(request)
+        return self._request("POST", f"/policy/{request.action}", data=data, headers=headers)
     
     def verify_zk_proof(self, proof: ZKProof) -> APIResponse:
         """Verify zero-knowledge proof"""
-        return self._request("POST", "/zk/attest", data={"proof": asdict(proof)})
+        return self._request("POST", "/zk/attest", data={"proof": proof.to_dict()})
     
     def get_policy_registry(self) -> APIResponse:
         """Get governance policy registry"""
@@ -291,6 +419,8 @@ def create_client(
     api_key: Optional[str] = None,
     timeout: int = 30,
     enable_mock_signatures: bool = False,
+    pool_maxsize: int = 64,
+    max_retries: int = 3,
 ) -> GENUSDClient:
     """
     Create GENUSD SDK client instance
@@ -300,6 +430,8 @@ def create_client(
         api_key: Optional API key
         timeout: Request timeout in seconds
         enable_mock_signatures: Enable mock signatures for testing
+        pool_maxsize: Max keep-alive connections per host
+        max_retries: Retries for connection errors and 502/503/504
     
     Returns:
         Configured GENUSDClient instance
@@ -309,4 +441,6 @@ def create_client(
         api_key=api_key,
         timeout=timeout,
         enable_mock_signatures=enable_mock_signatures,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
     )
@@ -17,6 +17,18 @@ class UTXO:
     status: Optional[Literal["active", "spent", "frozen"]] = "active"
     created_at: Optional[int] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "owner_id": self.owner_id,
+            "amount": self.amount,
+            "asset_code": self.asset_code,
+            "kyc_tag": self.kyc_tag,
+            "utxo_id": self.utxo_id,
+            "status": self.status,
+            "created_at": self.created_at,
+        }
+
 
 @dataclass
 class MintRequest:
@@ -25,6 +37,14 @@ class MintRequest:
     issuer_id: str
     dilithium_signature: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "outputs": [utxo.to_dict() for utxo in self.outputs],
+            "issuer_id": self.issuer_id,
+            "dilithium_signature": self.dilithium_signature,
+        }
+
 
 @dataclass
 class TransferRequest:
@@ -34,6 +54,15 @@ class TransferRequest:
     sender_id: str
     dilithium_signature: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "inputs": self.inputs,
+            "outputs": [utxo.to_dict() for utxo in self.outputs],
+            "sender_id": self.sender_id,
+            "dilithium_signature": self.dilithium_signature,
+        }
+
 
 @dataclass
 class BurnRequest:
@@ -42,6 +71,14 @@ class BurnRequest:
     burner_id: str
     dilithium_signature: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "inputs": self.inputs,
+            "burner_id": self.burner_id,
+            "dilithium_signature": self.dilithium_signature,
+        }
+
 
 @dataclass
 class GovernanceRequest:
@@ -55,6 +92,19 @@ class GovernanceRequest:
     reason: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "action": self.action,
+            "admin_id": self.admin_id,
+            "dilithium_signature": self.dilithium_signature,
+            "target_user": self.target_user,
+            "target_utxo": self.target_utxo,
+            "amount": self.amount,
+            "reason": self.reason,
+            "extra": self.extra,
+        }
+
 
 @dataclass
 class ZKProof:
@@ -65,6 +115,16 @@ class ZKProof:
     nullifier: str
     metadata: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "proof_bytes": self.proof_bytes,
+            "public_inputs": self.public_inputs,
+            "commitment": self.commitment,
+            "nullifier": self.nullifier,
+            "metadata": self.metadata,
+        }
+
 
 @dataclass
 class APIResponse:
@@ -73,3 +133,13 @@ class APIResponse:
     data: Optional[Any] = None
     error: Optional[str] = None
     tx_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "APIResponse":
+        """Build from a decoded response body, ignoring unknown fields"""
+        return cls(
+            success=result.get("success", False),
+            data=result.get("data"),
+            error=result.get("error"),
+            tx_id=result.get("tx_id"),
+        )
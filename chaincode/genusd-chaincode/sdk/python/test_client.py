@@ -0,0 +1,222 @@
+"""
+GENUSD SDK Client Tests
+
+Checks the signed request bodies produced by the client builders.
+
+Run with: python3 test_client.py
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from genusd_sdk import (
+    AsyncGENUSDClient,
+    GENUSDClient,
+    UTXO,
+    MintRequest,
+    TransferRequest,
+    BurnRequest,
+    GovernanceRequest,
+)
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Echo each POST body back as the response data, tracking peak concurrency"""
+
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.01)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with cls.lock:
+            cls.active -= 1
+
+        payload = json.dumps({"success": True, "data": body, "tx_id": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        # Stand-in for a proxy error page
+        page = b"<html><body>404 Not Found</body></html>"
+        self.send_response(404)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_mock_api():
+    """Serve MockAPIHandler on a free local port; returns (server, api_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockAPIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def decode_pairs(body):
+    """Decode a JSON object body into its (key, value) pairs, keeping duplicates"""
+    return json.loads(body, object_pairs_hook=list)
+
+
+class TestRequestBodies(unittest.TestCase):
+    """Signed POST bodies carry exactly one dilithium_signature"""
+
+    def setUp(self):
+        self.client = GENUSDClient("http://localhost:3000/api/v1", enable_mock_signatures=True)
+        self.utxo = UTXO(owner_id="user_a", amount=1_000, asset_code="GENUSD")
+
+    def assertSignedOnce(self, body, headers):
+        pairs = decode_pairs(body)
+        keys = [k for k, _ in pairs]
+        self.assertEqual(keys.count("dilithium_signature"), 1, keys)
+        self.assertEqual(dict(pairs)["dilithium_signature"], headers["X-Dilithium-Signature"])
+
+    def test_governance_body_has_single_signature(self):
+        """Test governance body replaces the request's empty signature field"""
+        request = GovernanceRequest(action="freeze", admin_id="admin", target_utxo="TX:0", reason="AML")
+        body, headers = self.client._build_governance(request)
+
+        self.assertSignedOnce(body, headers)
+        self.assertEqual(
+            [k for k, _ in decode_pairs(body)],
+            list(request.to_dict()),
+        )
+
+    def test_governance_body_keeps_explicit_signature(self):
+        """Test a caller-supplied signature is sent as-is"""
+        request = GovernanceRequest(action="unfreeze", admin_id="admin", dilithium_signature="SIG")
+        body, _ = self.client._build_governance(request)
+
+        pairs = decode_pairs(body)
+        self.assertEqual([k for k, _ in pairs].count("dilithium_signature"), 1)
+        self.assertEqual(dict(pairs)["dilithium_signature"], "SIG")
+
+    def test_utxo_bodies_have_single_signature(self):
+        """Test mint, transfer and burn bodies each carry one signature"""
+        builders = [
+            (self.client._build_mint, MintRequest(outputs=[self.utxo], issuer_id="issuer")),
+            (self.client._build_transfer, TransferRequest(inputs=["TX:0"], outputs=[self.utxo], sender_id="user_a")),
+            (self.client._build_burn, BurnRequest(inputs=["TX:0"], burner_id="user_a")),
+        ]
+        for build, request in builders:
+            with self.subTest(request=type(request).__name__):
+                self.assertSignedOnce(*build(request))
+
+
+class TestNonASCIIPayloads(unittest.TestCase):
+    """Signed messages stay ASCII so they fit in HTTP headers"""
+
+    def test_unsigned_mint_with_non_ascii_owner(self):
+        """Test the raw message header for a non-ASCII owner_id is latin-1 encodable"""
+        client = GENUSDClient("http://localhost:3000/api/v1")
+        request = MintRequest(
+            outputs=[UTXO(owner_id="李", amount=1_000, asset_code="GENUSD")],
+            issuer_id="issuer",
+        )
+        body, headers = client._build_mint(request)
+
+        headers["X-Dilithium-Signature"].encode("latin-1")
+        self.assertIn("\\u674e", headers["X-Dilithium-Signature"])
+        self.assertTrue(body.isascii())
+        self.assertEqual(json.loads(body)["outputs"][0]["owner_id"], "李")
+
+
+
+class TestAsyncBulk(unittest.TestCase):
+    """AsyncGENUSDClient bulk submission against a local mock API"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.api_url = start_mock_api()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        MockAPIHandler.peak = 0
+        # Built outside the event loop, as callers of asyncio.run() do
+        self.client = AsyncGENUSDClient(self.api_url, enable_mock_signatures=True, rate_limit=3)
+
+    def run_bulk(self, method, requests):
+        async def submit():
+            async with self.client as client:
+                return await getattr(client, method)(requests)
+        return asyncio.run(submit())
+
+    def test_bulk_mint_preserves_order(self):
+        """Test bulk_mint returns one result per request, in order, within rate_limit"""
+        requests = [
+            MintRequest(outputs=[UTXO(owner_id=f"user_{i}", amount=i + 1, asset_code="GENUSD")], issuer_id="issuer")
+            for i in range(12)
+        ]
+        results = self.run_bulk("bulk_mint", requests)
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual([r.data["outputs"][0]["owner_id"] for r in results], [f"user_{i}" for i in range(12)])
+        self.assertLessEqual(MockAPIHandler.peak, 3)
+
+    def test_bulk_transfer_matches_sync_body(self):
+        """Test bulk_transfer sends the same signed body as the sync client"""
+        utxo = UTXO(owner_id="user_b", amount=500, asset_code="GENUSD")
+        requests = [TransferRequest(inputs=[f"TX:{i}"], outputs=[utxo], sender_id="user_a") for i in range(6)]
+        results = self.run_bulk("bulk_transfer", requests)
+
+        sync_client = GENUSDClient(self.api_url, enable_mock_signatures=True)
+        for request, result in zip(requests, results):
+            body, _ = sync_client._build_transfer(request)
+            self.assertTrue(result.success, result.error)
+            self.assertEqual(result.tx_id, "/transfer")
+            self.assertEqual(result.data, json.loads(body))
+
+
+
+class TestErrorResponses(unittest.TestCase):
+    """Non-JSON error bodies are reported by HTTP status"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server, cls.api_url = start_mock_api()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_sync_html_error_page(self):
+        """Test the sync client reports HTTP 404 for an HTML error body"""
+        result = GENUSDClient(self.api_url).get_utxo("TX:0")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "HTTP 404")
+
+    def test_async_html_error_page(self):
+        """Test the async client reports HTTP 404 for an HTML error body"""
+        async def fetch():
+            async with AsyncGENUSDClient(self.api_url) as client:
+                return await client.get_utxo("TX:0")
+        result = asyncio.run(fetch())
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "HTTP 404")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
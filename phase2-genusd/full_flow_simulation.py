@@ -12,44 +12,110 @@ Validates UTXO set at each step.
 
 from genusd_engine import GENUSDEngine, generate_mock_signature, generate_attestation
 import json
+import sys
 
 
-def print_state(engine, step_name):
-    """Print current UTXO set state"""
-    print(f"\n{'='*60}")
-    print(f"STATE AFTER: {step_name}")
-    print(f"{'='*60}")
-    print(f"Total Supply: ${engine.get_total_supply()/100:.2f}")
-    print(f"Verified Reserves: ${engine.verified_reserves/100:.2f}")
-    print(f"\nUTXO Set ({len([u for u in engine.utxos.values() if u.status == 'active'])} active):")
-    
-    for utxo_id, utxo in engine.utxos.items():
+RULE = "=" * 60
+
+# x509 identities used by the simulation, built once
+USERS = {name: f"x509::/C=US/O=Org1/CN={name}" for name in ("userA", "userB")}
+SHORT_NAMES = {dn: name for name, dn in USERS.items()}
+
+# Values shared by every output in the flow
+POLICY = "POLICY_V1.0"
+KYC_TAG = "KYC_LEVEL_2"
+BASE_METADATA = {
+    "jurisdiction": "US",
+    "blacklist_flag": False,
+    "freeze_reason": None,
+    "policy_version": POLICY,
+    "issuer_attestation": generate_attestation("reserve_proof_1"),
+}
+
+
+def make_output(owner_id, amount, created_at):
+    """Build a GENUSD output spec from the shared defaults"""
+    return {
+        "owner_id": owner_id,
+        "asset_code": "GENUSD",
+        "amount": amount,
+        "status": "active",
+        "kyc_tag": KYC_TAG,
+        "created_at": created_at,
+        "metadata": dict(BASE_METADATA),
+    }
+
+
+def active_balances(engine):
+    """Sum every active UTXO per short user name in a single pass"""
+    balances = dict.fromkeys(USERS, 0)
+    for utxo in engine.utxos.values():
         if utxo.status == "active":
-            print(f"  {utxo_id}:")
-            print(f"    Owner: {utxo.owner_id.split('CN=')[1].split(':')[0] if 'CN=' in utxo.owner_id else utxo.owner_id}")
-            print(f"    Amount: ${utxo.amount/100:.2f}")
-            print(f"    Status: {utxo.status}")
-    
-    print(f"\nBalances:")
-    for owner_id in ['userA', 'userB']:
-        full_id = f"x509::/C=US/O=Org1/CN={owner_id}"
-        balance = engine.get_balance(full_id)
-        print(f"  {owner_id}: ${balance/100:.2f}")
-    print()
+            name = SHORT_NAMES.get(utxo.owner_id)
+            if name is not None:
+                balances[name] += utxo.amount
+    return balances
+
+
+def engine_balances(engine):
+    """Balances as reported by the engine's running per-owner totals"""
+    return {name: engine.get_balance(owner_id) for name, owner_id in USERS.items()}
+
+
+def check_balances(engine, expected, step):
+    """Check the engine's balances against expected values and the UTXO set"""
+    actual = engine_balances(engine)
+    mismatched = {u: (e, actual[u]) for u, e in expected.items() if actual[u] != e}
+    assert not mismatched, f"Balance mismatch after {step}: {mismatched}"
+
+    # The running totals must agree with a fresh re-sum of active UTXOs
+    resummed = active_balances(engine)
+    assert actual == resummed, f"Balance counters drifted after {step}: {actual} != {resummed}"
+
+
+def print_state(engine, step_name):
+    """Print current UTXO set state (buffered into a single write)"""
+    active = [(utxo_id, utxo) for utxo_id, utxo in engine.utxos.items() if utxo.status == "active"]
+
+    lines = [
+        "",
+        RULE,
+        f"STATE AFTER: {step_name}",
+        RULE,
+        f"Total Supply: ${engine.get_total_supply()/100:.2f}",
+        f"Verified Reserves: ${engine.verified_reserves/100:.2f}",
+        f"\nUTXO Set ({len(active)} active):",
+    ]
+    lines.extend(
+        f"  {utxo_id}:\n"
+        f"    Owner: {SHORT_NAMES.get(utxo.owner_id, utxo.owner_id)}\n"
+        f"    Amount: ${utxo.amount/100:.2f}\n"
+        f"    Status: {utxo.status}"
+        for utxo_id, utxo in active
+    )
+    lines.append("\nBalances:")
+    lines.extend(
+        f"  {owner_id}: ${balance/100:.2f}"
+        for owner_id, balance in engine_balances(engine).items()
+    )
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main():
-    print("="*60)
+    print(RULE)
     print("GENUSD FULL FLOW SIMULATION - STEP 9 VALIDATION")
-    print("="*60)
+    print(RULE)
     
     # Initialize engine
     engine = GENUSDEngine()
     engine.set_verified_reserves(100_000_000)  # $1M reserves
     
     # Register users
-    engine.policy_engine.register_kyc("x509::/C=US/O=Org1/CN=userA", "KYC_LEVEL_2")
-    engine.policy_engine.register_kyc("x509::/C=US/O=Org1/CN=userB", "KYC_LEVEL_2")
+    engine.policy_engine.register_kyc(USERS["userA"], KYC_TAG)
+    engine.policy_engine.register_kyc(USERS["userB"], KYC_TAG)
     
     print("\nInitial State:")
     print(f"  Verified Reserves: ${engine.verified_reserves/100:.2f}")
@@ -64,22 +130,10 @@ def main():
         "tx_id": "MINT_SIM_001",
         "timestamp": 1732867200,
         "inputs": [],
-        "outputs": [{
-            "owner_id": "x509::/C=US/O=Org1/CN=userA",
-            "asset_code": "GENUSD",
-            "amount": 1_000_000,  # $10,000.00
-            "status": "active",
-            "kyc_tag": "KYC_LEVEL_2",
-            "created_at": 1732867200,
-            "metadata": {
-                "jurisdiction": "US",
-                "blacklist_flag": False,
-                "freeze_reason": None,
-                "policy_version": "POLICY_V1.0",
-                "issuer_attestation": generate_attestation("reserve_proof_1")
-            }
-        }],
-        "policy_ref": "POLICY_V1.0",
+        "outputs": [
+            make_output(USERS["userA"], 1_000_000, 1732867200)  # $10,000.00
+        ],
+        "policy_ref": POLICY,
         "signatures": {"issuer": generate_mock_signature("issuer", "MINT_SIM_001")},
         "metadata": {"memo": "Mint $10,000 to userA"}
     }
@@ -89,7 +143,7 @@ def main():
     print_state(engine, "STEP 1 - Mint $10,000 to userA")
     
     # Validate
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userA") == 1_000_000, "userA balance incorrect after mint"
+    check_balances(engine, {"userA": 1_000_000}, "mint")
     assert engine.get_total_supply() == 1_000_000, "Total supply incorrect after mint"
     
     # ========================================================================
@@ -102,39 +156,11 @@ def main():
         "timestamp": 1732867260,
         "inputs": ["MINT_SIM_001:0"],
         "outputs": [
-            {
-                "owner_id": "x509::/C=US/O=Org1/CN=userB",
-                "asset_code": "GENUSD",
-                "amount": 600_000,  # $6,000.00
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": 1732867260,
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("reserve_proof_1")
-                }
-            },
-            {
-                "owner_id": "x509::/C=US/O=Org1/CN=userA",
-                "asset_code": "GENUSD",
-                "amount": 400_000,  # $4,000.00 change
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": 1732867260,
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("reserve_proof_1")
-                }
-            }
+            make_output(USERS["userB"], 600_000, 1732867260),  # $6,000.00
+            make_output(USERS["userA"], 400_000, 1732867260)  # $4,000.00 change
         ],
-        "policy_ref": "POLICY_V1.0",
-        "signatures": {"x509::/C=US/O=Org1/CN=userA": generate_mock_signature("userA", "TRANSFER_SIM_002")},
+        "policy_ref": POLICY,
+        "signatures": {USERS["userA"]: generate_mock_signature("userA", "TRANSFER_SIM_002")},
         "metadata": {"memo": "Payment to userB with change"}
     }
     
@@ -143,8 +169,7 @@ def main():
     print_state(engine, "STEP 2 - Transfer $6,000 to userB (with $4,000 change)")
     
     # Validate
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userA") == 400_000, "userA balance incorrect after transfer 1"
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userB") == 600_000, "userB balance incorrect after transfer 1"
+    check_balances(engine, {"userA": 400_000, "userB": 600_000}, "transfer 1")
     assert engine.get_total_supply() == 1_000_000, "Total supply should remain constant"
     
     # ========================================================================
@@ -157,39 +182,11 @@ def main():
         "timestamp": 1732867320,
         "inputs": ["TRANSFER_SIM_002:0"],  # userB's $6000 UTXO
         "outputs": [
-            {
-                "owner_id": "x509::/C=US/O=Org1/CN=userA",
-                "asset_code": "GENUSD",
-                "amount": 200_000,  # $2,000.00
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": 1732867320,
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("reserve_proof_1")
-                }
-            },
-            {
-                "owner_id": "x509::/C=US/O=Org1/CN=userB",
-                "asset_code": "GENUSD",
-                "amount": 400_000,  # $4,000.00 change
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": 1732867320,
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("reserve_proof_1")
-                }
-            }
+            make_output(USERS["userA"], 200_000, 1732867320),  # $2,000.00
+            make_output(USERS["userB"], 400_000, 1732867320)  # $4,000.00 change
         ],
-        "policy_ref": "POLICY_V1.0",
-        "signatures": {"x509::/C=US/O=Org1/CN=userB": generate_mock_signature("userB", "TRANSFER_SIM_003")},
+        "policy_ref": POLICY,
+        "signatures": {USERS["userB"]: generate_mock_signature("userB", "TRANSFER_SIM_003")},
         "metadata": {"memo": "Transfer $2,000 back to userA"}
     }
     
@@ -198,8 +195,7 @@ def main():
     print_state(engine, "STEP 3 - Transfer $2,000 back to userA")
     
     # Validate
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userA") == 600_000, "userA balance incorrect after transfer 2"  # $4000 + $2000
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userB") == 400_000, "userB balance incorrect after transfer 2"  # $6000 - $2000
+    check_balances(engine, {"userA": 600_000, "userB": 400_000}, "transfer 2")  # $4000 + $2000, $6000 - $2000
     assert engine.get_total_supply() == 1_000_000, "Total supply should remain constant"
     
     # ========================================================================
@@ -212,10 +208,10 @@ def main():
         "timestamp": 1732867380,
         "inputs": ["TRANSFER_SIM_003:1"],  # userB's $4000 UTXO
         "outputs": [],
-        "policy_ref": "POLICY_V1.0",
+        "policy_ref": POLICY,
         "signatures": {
             "issuer": generate_mock_signature("issuer", "BURN_SIM_004"),
-            "x509::/C=US/O=Org1/CN=userB": generate_mock_signature("userB", "BURN_SIM_004")
+            USERS["userB"]: generate_mock_signature("userB", "BURN_SIM_004")
         },
         "metadata": {"memo": "Redeem $4,000 for fiat"}
     }
@@ -225,25 +221,24 @@ def main():
     print_state(engine, "STEP 4 - Burn $4,000 from userB")
     
     # Validate
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userA") == 600_000, "userA balance should be unchanged"
-    assert engine.get_balance("x509::/C=US/O=Org1/CN=userB") == 0, "userB balance should be 0 after burn"
+    check_balances(engine, {"userA": 600_000, "userB": 0}, "burn")
     assert engine.get_total_supply() == 600_000, "Total supply should decrease by $4000"
     
     # ========================================================================
     # FINAL VALIDATION
     # ========================================================================
     
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("FINAL VALIDATION RESULTS")
-    print("="*60)
+    print(RULE)
     
     # Check UTXO set consistency
     active_utxos = [u for u in engine.utxos.values() if u.status == "active"]
-    spent_utxos = [u for u in engine.utxos.values() if u.status == "spent"]
+    spent_utxos = list(engine.spent_archive.values())
     
     print(f"\n✅ Active UTXOs: {len(active_utxos)}")
     print(f"✅ Spent UTXOs: {len(spent_utxos)}")
-    print(f"✅ Total UTXOs: {len(engine.utxos)}")
+    print(f"✅ Total UTXOs: {len(engine.utxos) + len(engine.spent_archive)}")
     
     # Calculate total from active UTXOs
     active_sum = sum(u.amount for u in active_utxos)
@@ -259,7 +254,7 @@ def main():
         "TRANSFER_SIM_003:0",       # Created in step 3, still active (userA $200)
         "TRANSFER_SIM_003:1",       # Created in step 3, spent in step 4
     }
-    actual_utxo_ids = set(engine.utxos.keys())
+    actual_utxo_ids = engine.utxos.keys() | engine.spent_archive.keys()
     assert expected_utxo_ids == actual_utxo_ids, f"UTXO ID mismatch!\nExpected: {expected_utxo_ids}\nActual: {actual_utxo_ids}"
     print(f"\n✅ Deterministic UTXO IDs verified")
     
@@ -269,16 +264,18 @@ def main():
         "userB": 0         # $4000 burned
     }
     
+    check_balances(engine, final_balances, "final validation")
+    balances = engine_balances(engine)
     for user, expected in final_balances.items():
-        actual = engine.get_balance(f"x509::/C=US/O=Org1/CN={user}")
+        actual = balances[user]
         assert actual == expected, f"{user} balance mismatch: expected ${expected/100:.2f}, got ${actual/100:.2f}"
         print(f"✅ {user} final balance: ${actual/100:.2f} (correct)")
     
     print(f"\n✅ Conservation law maintained throughout")
     print(f"✅ All assertions passed")
-    print("\n" + "="*60)
+    print("\n" + RULE)
     print("🎉 FULL FLOW SIMULATION SUCCESSFUL!")
-    print("="*60)
+    print(RULE)
     
     return engine
 
@@ -15,8 +15,10 @@ Features:
 import json
 import hashlib
 import time
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -54,6 +56,25 @@ KYC_DAILY_LIMITS = {
     KYCLevel.LEVEL_3: 999_999_999_999  # Unlimited (10T)
 }
 
+# Same limits keyed by the raw tag string, so hot paths skip KYCLevel(...) lookups
+KYC_LIMITS_BY_STR = {level.value: limit for level, limit in KYC_DAILY_LIMITS.items()}
+# Raw enum values, so per-UTXO checks compare strings instead of
+# resolving enum attributes
+_ACTIVE = UTXOStatus.ACTIVE.value
+_SPENT = UTXOStatus.SPENT.value
+_FROZEN = UTXOStatus.FROZEN.value
+_KYC_L0 = KYCLevel.LEVEL_0.value
+_STATUS_VALUES = {status.value: status.value for status in UTXOStatus}  # canonical string objects
+
+KYC_VALID = frozenset(KYC_LIMITS_BY_STR) - {_KYC_L0}
+
+
+# Transaction fields in constructor order
+TX_FIELDS = ("type", "tx_id", "timestamp", "inputs", "outputs", "policy_ref", "signatures", "metadata")
+
+# Fields every transaction output must carry
+OUTPUT_FIELDS = ("owner_id", "asset_code", "amount", "status", "kyc_tag", "created_at", "metadata")
+_OUTPUT_FIELD_SET = frozenset(OUTPUT_FIELDS)
 
 ASSET_CODE = "GENUSD"
 MAX_UTXO_AMOUNT = 999_999_999_999_999  # 10 trillion dollars max per UTXO
@@ -66,6 +87,8 @@ MAX_UTXO_AMOUNT = 999_999_999_999_999  # 10 trillion dollars max per UTXO
 @dataclass
 class UTXOMetadata:
     """Compliance and policy metadata for UTXO"""
+    __slots__ = ("jurisdiction", "blacklist_flag", "freeze_reason", "policy_version", "issuer_attestation")
+
     jurisdiction: str
     blacklist_flag: bool
     freeze_reason: Optional[str]
@@ -76,6 +99,8 @@ class UTXOMetadata:
 @dataclass
 class UTXO:
     """Unspent Transaction Output"""
+    __slots__ = ("utxo_id", "owner_id", "asset_code", "amount", "status", "kyc_tag", "created_at", "metadata")
+
     utxo_id: str
     owner_id: str
     asset_code: str
@@ -87,9 +112,23 @@ class UTXO:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        result = asdict(self)
-        result['metadata'] = asdict(self.metadata)
-        return result
+        metadata = self.metadata
+        return {
+            "utxo_id": self.utxo_id,
+            "owner_id": self.owner_id,
+            "asset_code": self.asset_code,
+            "amount": self.amount,
+            "status": self.status,
+            "kyc_tag": self.kyc_tag,
+            "created_at": self.created_at,
+            "metadata": {
+                "jurisdiction": metadata.jurisdiction,
+                "blacklist_flag": metadata.blacklist_flag,
+                "freeze_reason": metadata.freeze_reason,
+                "policy_version": metadata.policy_version,
+                "issuer_attestation": metadata.issuer_attestation,
+            },
+        }
 
     @staticmethod
     def from_dict(data: dict) -> 'UTXO':
@@ -100,16 +139,28 @@ class UTXO:
             owner_id=data['owner_id'],
             asset_code=data['asset_code'],
             amount=data['amount'],
-            status=data['status'],
+            status=_STATUS_VALUES.get(data['status'], data['status']),
             kyc_tag=data['kyc_tag'],
             created_at=data['created_at'],
             metadata=metadata
         )
 
+    def copy(self) -> 'UTXO':
+        """Copy UTXO and its metadata (both are mutated by freeze/spend)"""
+        m = self.metadata
+        return UTXO(
+            self.utxo_id, self.owner_id, self.asset_code, self.amount,
+            self.status, self.kyc_tag, self.created_at,
+            UTXOMetadata(m.jurisdiction, m.blacklist_flag, m.freeze_reason,
+                         m.policy_version, m.issuer_attestation)
+        )
+
 
 @dataclass
 class Transaction:
     """Base transaction structure"""
+    __slots__ = TX_FIELDS
+
     type: str
     tx_id: str
     timestamp: int
@@ -121,7 +172,27 @@ class Transaction:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        return {
+            "type": self.type,
+            "tx_id": self.tx_id,
+            "timestamp": self.timestamp,
+            "inputs": list(self.inputs),
+            "outputs": [{**out, "metadata": dict(out["metadata"])} for out in self.outputs],
+            "policy_ref": self.policy_ref,
+            "signatures": dict(self.signatures),
+            "metadata": dict(self.metadata),
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Transaction':
+        """Create Transaction from dictionary, rejecting missing or unknown fields"""
+        missing = [name for name in TX_FIELDS if name not in data]
+        if missing:
+            raise ValueError(f"missing fields: {', '.join(missing)}")
+        if len(data) != len(TX_FIELDS):
+            unknown = sorted(set(data) - set(TX_FIELDS))
+            raise ValueError(f"unknown fields: {', '.join(unknown)}")
+        return Transaction(*[data[name] for name in TX_FIELDS])
 
 
 # ============================================================================
@@ -137,6 +208,8 @@ class PolicyEngine:
         self.allowed_jurisdictions = {"US", "GB", "SG", "JP", "CH"}
         self.kyc_registry = {}  # owner_id -> KYC level
         self.daily_transfer_tracking = {}  # owner_id -> {date: amount}
+        self._today_bucket = -1  # UTC day number of the cached date string
+        self._today_str = ""
 
         # Load default policy
         self._load_default_policy()
@@ -156,6 +229,10 @@ class PolicyEngine:
         """Register user's KYC level"""
         self.kyc_registry[owner_id] = kyc_level
 
+    def register_kyc_bulk(self, registrations: Dict[str, str]):
+        """Register many users' KYC levels (owner_id -> KYC level) at once"""
+        self.kyc_registry.update(registrations)
+
     def get_kyc_level(self, owner_id: str) -> Optional[str]:
         """Get user's KYC level"""
         return self.kyc_registry.get(owner_id)
@@ -168,24 +245,29 @@ class PolicyEngine:
         """Check if owner is blacklisted"""
         return owner_id in self.blacklist
 
+    def _today(self) -> str:
+        """Today's UTC date (YYYY-MM-DD), reformatted only when the day changes"""
+        bucket = int(time.time()) // 86400
+        if bucket != self._today_bucket:
+            self._today_bucket = bucket
+            self._today_str = time.strftime("%Y-%m-%d", time.gmtime(bucket * 86400))
+        return self._today_str
+
     def check_daily_limit(self, owner_id: str, amount: int) -> Tuple[bool, str]:
         """Check if transfer amount within daily limit"""
         kyc_level = self.get_kyc_level(owner_id)
         if not kyc_level:
             return False, f"Owner {owner_id} has no KYC registration"
 
-        kyc_enum = KYCLevel(kyc_level)
-        daily_limit = KYC_DAILY_LIMITS[kyc_enum]
+        daily_limit = KYC_LIMITS_BY_STR.get(kyc_level)
+        if daily_limit is None:
+            return False, f"Invalid KYC level for {owner_id}: {kyc_level}"
 
         # Get today's date
-        today = time.strftime("%Y-%m-%d", time.gmtime())
-
-        # Initialize tracking if needed
-        if owner_id not in self.daily_transfer_tracking:
-            self.daily_transfer_tracking[owner_id] = {}
+        today = self._today()
 
         # Get today's transferred amount
-        today_amount = self.daily_transfer_tracking[owner_id].get(today, 0)
+        today_amount = self.daily_transfer_tracking.get(owner_id, {}).get(today, 0)
 
         # Check limit
         if today_amount + amount > daily_limit:
@@ -196,11 +278,12 @@ class PolicyEngine:
 
     def record_transfer(self, owner_id: str, amount: int):
         """Record transfer for daily limit tracking"""
-        today = time.strftime("%Y-%m-%d", time.gmtime())
-        if owner_id not in self.daily_transfer_tracking:
-            self.daily_transfer_tracking[owner_id] = {}
-        self.daily_transfer_tracking[owner_id][today] = \
-            self.daily_transfer_tracking[owner_id].get(today, 0) + amount
+        today = self._today()
+        days = self.daily_transfer_tracking.get(owner_id)
+        if days is None or today not in days:
+            # Only today's total is ever read, so earlier days are dropped
+            days = self.daily_transfer_tracking[owner_id] = {today: 0}
+        days[today] += amount
 
     def validate_jurisdiction(self, jurisdiction: str) -> bool:
         """Check if jurisdiction is allowed"""
@@ -215,11 +298,19 @@ class GENUSDEngine:
     """Core UTXO transaction processing engine"""
 
     def __init__(self):
-        self.utxos: Dict[str, UTXO] = {}  # utxo_id -> UTXO
+        self.utxos: Dict[str, UTXO] = {}  # utxo_id -> live (active/frozen) UTXO
+        self.spent_archive: Dict[str, UTXO] = {}  # utxo_id -> spent UTXO, kept for history
+        self.owner_index: Dict[str, Dict[str, UTXO]] = defaultdict(dict)  # owner_id -> active UTXOs
+        self.balances: Dict[str, int] = defaultdict(int)  # owner_id -> sum of active UTXOs
         self.transactions: Dict[str, Transaction] = {}  # tx_id -> Transaction
         self.total_supply = 0
         self.verified_reserves = 0  # Tracked separately
         self.policy_engine = PolicyEngine()
+        self._handlers = {
+            TransactionType.MINT.value: self._process_mint,
+            TransactionType.TRANSFER.value: self._process_transfer,
+            TransactionType.BURN.value: self._process_burn,
+        }
 
     # ========================================================================
     # STATE QUERIES
@@ -227,22 +318,16 @@ class GENUSDEngine:
 
     def get_utxo(self, utxo_id: str) -> Optional[UTXO]:
         """Retrieve UTXO by ID"""
-        return self.utxos.get(utxo_id)
+        return self.utxos.get(utxo_id) or self.spent_archive.get(utxo_id)
 
     def get_balance(self, owner_id: str) -> int:
         """Get total balance for owner (sum of active UTXOs)"""
-        return sum(
-            utxo.amount
-            for utxo in self.utxos.values()
-            if utxo.owner_id == owner_id and utxo.status == UTXOStatus.ACTIVE.value
-        )
+        return self.balances.get(owner_id, 0)
 
     def get_owner_utxos(self, owner_id: str) -> List[UTXO]:
         """Get all active UTXOs for owner"""
-        return [
-            utxo for utxo in self.utxos.values()
-            if utxo.owner_id == owner_id and utxo.status == UTXOStatus.ACTIVE.value
-        ]
+        owned = self.owner_index.get(owner_id)
+        return list(owned.values()) if owned else []
 
     def get_total_supply(self) -> int:
         """Get total active supply"""
@@ -262,11 +347,13 @@ class GENUSDEngine:
         if not utxo:
             return False, f"UTXO {utxo_id} not found"
 
-        if utxo.status == UTXOStatus.SPENT.value:
+        if utxo.status == _SPENT:
             return False, f"Cannot freeze spent UTXO {utxo_id}"
 
-        utxo.status = UTXOStatus.FROZEN.value
+        utxo.status = _FROZEN
         utxo.metadata.freeze_reason = reason
+        if self.owner_index[utxo.owner_id].pop(utxo_id, None) is not None:
+            self.balances[utxo.owner_id] -= utxo.amount
         return True, f"UTXO {utxo_id} frozen"
 
     def unfreeze_utxo(self, utxo_id: str) -> Tuple[bool, str]:
@@ -275,11 +362,13 @@ class GENUSDEngine:
         if not utxo:
             return False, f"UTXO {utxo_id} not found"
 
-        if utxo.status != UTXOStatus.FROZEN.value:
+        if utxo.status != _FROZEN:
             return False, f"UTXO {utxo_id} is not frozen"
 
-        utxo.status = UTXOStatus.ACTIVE.value
+        utxo.status = _ACTIVE
         utxo.metadata.freeze_reason = None
+        self.owner_index[utxo.owner_id][utxo_id] = utxo
+        self.balances[utxo.owner_id] += utxo.amount
         return True, f"UTXO {utxo_id} unfrozen"
 
     # ========================================================================
@@ -290,23 +379,52 @@ class GENUSDEngine:
         """
         Main transaction processing entry point.
 
-        Returns: (success, message, tx_id)
+        Returns: (success, message, tx_id). The message is empty on success;
+        use summary(tx_id) for a human-readable description.
         """
         # Parse transaction
         try:
-            tx = Transaction(**tx_data)
+            tx = Transaction.from_dict(tx_data)
         except Exception as e:
             return False, f"Invalid transaction format: {str(e)}", None
 
         # Route to appropriate handler
-        if tx.type == TransactionType.MINT.value:
-            return self._process_mint(tx)
-        elif tx.type == TransactionType.TRANSFER.value:
-            return self._process_transfer(tx)
-        elif tx.type == TransactionType.BURN.value:
-            return self._process_burn(tx)
-        else:
+        handler = self._handlers.get(tx.type)
+        if handler is None:
             return False, f"Unknown transaction type: {tx.type}", None
+        return handler(tx)
+
+    def process_batch(
+        self, txs: List[dict], stop_on_error: bool = False
+    ) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Process transactions in order (replay, bulk mint).
+
+        Returns one (success, message, tx_id) per processed transaction. With
+        stop_on_error the batch ends at the first failure.
+        """
+        process = self.process_transaction
+        results = []
+        for tx_data in txs:
+            result = process(tx_data)
+            results.append(result)
+            if stop_on_error and not result[0]:
+                break
+        return results
+
+    def summary(self, tx_id: str) -> str:
+        """Describe a processed transaction (built on demand, not per transaction)"""
+        tx = self.transactions.get(tx_id)
+        if not tx:
+            return f"Transaction {tx_id} not found"
+
+        if tx.type == TransactionType.MINT.value:
+            minted = sum(out['amount'] for out in tx.outputs)
+            return f"MINT successful: {len(tx.outputs)} UTXOs created, ${minted/100:.2f} minted"
+        if tx.type == TransactionType.TRANSFER.value:
+            return f"TRANSFER successful: {len(tx.inputs)} inputs spent, {len(tx.outputs)} outputs created"
+        burned = sum(self.get_utxo(utxo_id).amount for utxo_id in tx.inputs)
+        return f"BURN successful: {len(tx.inputs)} UTXOs burned, ${burned/100:.2f} destroyed"
 
     # ========================================================================
     # MINT TRANSACTION
@@ -344,16 +462,13 @@ class GENUSDEngine:
                 return False, f"Output {idx}: {msg}", None
 
         # 6. Execute: Create outputs
-        for idx, out in enumerate(tx.outputs):
-            utxo_id = f"{tx.tx_id}:{idx}"
-            utxo = self._create_utxo(utxo_id, out, tx.timestamp)
-            self.utxos[utxo_id] = utxo
+        self._create_outputs(tx)
 
         # 7. Update state
         self.total_supply += total_mint_amount
         self.transactions[tx.tx_id] = tx
 
-        return True, f"MINT successful: {len(tx.outputs)} UTXOs created, ${total_mint_amount/100:.2f} minted", tx.tx_id
+        return True, "", tx.tx_id
 
     def _validate_mint_schema(self, tx: Transaction) -> Tuple[bool, str]:
         """Validate MINT transaction schema"""
@@ -377,45 +492,48 @@ class GENUSDEngine:
         if not success:
             return False, msg, None
 
-        # 2. Validate inputs exist and are spendable
+        # 2. Validate inputs in a single pass: spendable, one owner, not flagged
         input_utxos = []
+        owner_id = None
+        input_sum = 0
+        get_utxo = self.utxos.get
         for utxo_id in tx.inputs:
-            utxo = self.get_utxo(utxo_id)
+            # Spent inputs are only in the archive; fall back so they report as spent
+            utxo = get_utxo(utxo_id) or self.spent_archive.get(utxo_id)
             if not utxo:
                 return False, f"Input UTXO {utxo_id} not found", None
 
-            if utxo.status != UTXOStatus.ACTIVE.value:
+            if utxo.status != _ACTIVE:
                 return False, f"Input UTXO {utxo_id} is not active (status: {utxo.status})", None
 
-            input_utxos.append(utxo)
+            if owner_id is None:
+                owner_id = utxo.owner_id
+            elif utxo.owner_id != owner_id:
+                return False, "All input UTXOs must belong to the same owner", None
 
-        # 3. Validate ownership (all inputs must have same owner)
-        owner_ids = set(utxo.owner_id for utxo in input_utxos)
-        if len(owner_ids) > 1:
-            return False, "All input UTXOs must belong to the same owner", None
+            if utxo.metadata.blacklist_flag:
+                return False, f"Input UTXO {utxo_id} belongs to blacklisted owner", None
 
-        owner_id = input_utxos[0].owner_id
+            input_sum += utxo.amount
+            input_utxos.append(utxo)
 
-        # 4. Validate sender signature
+        # 3. Validate sender signature
         if owner_id not in tx.signatures:
             return False, f"Missing signature from owner {owner_id}", None
 
-        # 5. Validate no blacklisted or frozen inputs
-        for utxo in input_utxos:
-            if utxo.metadata.blacklist_flag:
-                return False, f"Input UTXO {utxo.utxo_id} belongs to blacklisted owner", None
-
-            if self.policy_engine.is_blacklisted(utxo.owner_id):
-                return False, f"Owner {utxo.owner_id} is blacklisted", None
+        # 4. Validate owner not blacklisted
+        blacklist = self.policy_engine.blacklist
+        if owner_id in blacklist:
+            return False, f"Owner {owner_id} is blacklisted", None
 
-        # 6. Validate conservation of value
-        input_sum = sum(utxo.amount for utxo in input_utxos)
+        # 5. Validate conservation of value
         output_sum = sum(out['amount'] for out in tx.outputs)
 
         if input_sum != output_sum:
             return False, f"Input sum (${input_sum/100:.2f}) != Output sum (${output_sum/100:.2f})", None
 
-        # 7. Validate outputs
+        # 6. Validate outputs
+        kyc_registry = self.policy_engine.kyc_registry
         for idx, out in enumerate(tx.outputs):
             success, msg = self._validate_output(out, idx)
             if not success:
@@ -423,34 +541,30 @@ class GENUSDEngine:
 
             # Check recipient KYC and daily limits
             recipient_id = out['owner_id']
-            recipient_kyc = self.policy_engine.get_kyc_level(recipient_id)
-            if not recipient_kyc:
+            if not kyc_registry.get(recipient_id):
                 return False, f"Recipient {recipient_id} has no KYC registration", None
 
             # Check recipient not blacklisted
-            if self.policy_engine.is_blacklisted(recipient_id):
+            if recipient_id in blacklist:
                 return False, f"Recipient {recipient_id} is blacklisted", None
 
-        # 8. Check sender daily limit
+        # 7. Check sender daily limit
         success, msg = self.policy_engine.check_daily_limit(owner_id, output_sum)
         if not success:
             return False, msg, None
 
-        # 9. Execute: Mark inputs as spent
+        # 8. Execute: Mark inputs as spent
         for utxo in input_utxos:
-            utxo.status = UTXOStatus.SPENT.value
+            self._spend_utxo(utxo)
 
-        # 10. Execute: Create outputs
-        for idx, out in enumerate(tx.outputs):
-            utxo_id = f"{tx.tx_id}:{idx}"
-            utxo = self._create_utxo(utxo_id, out, tx.timestamp)
-            self.utxos[utxo_id] = utxo
+        # 9. Execute: Create outputs
+        self._create_outputs(tx)
 
-        # 11. Update state
+        # 10. Update state
         self.policy_engine.record_transfer(owner_id, output_sum)
         self.transactions[tx.tx_id] = tx
 
-        return True, f"TRANSFER successful: {len(tx.inputs)} inputs spent, {len(tx.outputs)} outputs created", tx.tx_id
+        return True, "", tx.tx_id
 
     def _validate_transfer_schema(self, tx: Transaction) -> Tuple[bool, str]:
         """Validate TRANSFER transaction schema"""
@@ -474,24 +588,27 @@ class GENUSDEngine:
         if not success:
             return False, msg, None
 
-        # 2. Validate inputs exist and are spendable
+        # 2. Validate inputs exist and are spendable, summing as we go
         input_utxos = []
+        burn_amount = 0
+        has_owner_sig = False
+        signatures = tx.signatures
+        get_utxo = self.utxos.get
         for utxo_id in tx.inputs:
-            utxo = self.get_utxo(utxo_id)
+            # Spent inputs are only in the archive; fall back so they report as spent
+            utxo = get_utxo(utxo_id) or self.spent_archive.get(utxo_id)
             if not utxo:
                 return False, f"Input UTXO {utxo_id} not found", None
 
-            if utxo.status != UTXOStatus.ACTIVE.value:
+            if utxo.status != _ACTIVE:
                 return False, f"Input UTXO {utxo_id} is not active (status: {utxo.status})", None
 
+            burn_amount += utxo.amount
+            has_owner_sig = has_owner_sig or utxo.owner_id in signatures
             input_utxos.append(utxo)
 
         # 3. Validate authorization (issuer OR owner)
-        owner_ids = set(utxo.owner_id for utxo in input_utxos)
-        has_issuer_sig = "issuer" in tx.signatures
-        has_owner_sig = any(owner_id in tx.signatures for owner_id in owner_ids)
-
-        if not (has_issuer_sig or has_owner_sig):
+        if not (has_owner_sig or "issuer" in signatures):
             return False, "BURN requires issuer or owner signature", None
 
         # 4. Validate minimum burn amount
@@ -499,19 +616,18 @@ class GENUSDEngine:
         if not policy:
             return False, f"Unknown policy: {tx.policy_ref}", None
 
-        burn_amount = sum(utxo.amount for utxo in input_utxos)
         if burn_amount < policy["min_burn_amount"]:
             return False, f"Burn amount ${burn_amount/100:.2f} below minimum ${policy['min_burn_amount']/100:.2f}", None
 
         # 5. Execute: Mark inputs as spent
         for utxo in input_utxos:
-            utxo.status = UTXOStatus.SPENT.value
+            self._spend_utxo(utxo)
 
         # 6. Update state
         self.total_supply -= burn_amount
         self.transactions[tx.tx_id] = tx
 
-        return True, f"BURN successful: {len(tx.inputs)} UTXOs burned, ${burn_amount/100:.2f} destroyed", tx.tx_id
+        return True, "", tx.tx_id
 
     def _validate_burn_schema(self, tx: Transaction) -> Tuple[bool, str]:
         """Validate BURN transaction schema"""
@@ -530,42 +646,48 @@ class GENUSDEngine:
     def _validate_output(self, output: dict, idx: int) -> Tuple[bool, str]:
         """Validate output UTXO structure and compliance"""
 
-        # Required fields
-        required = ['owner_id', 'asset_code', 'amount', 'status', 'kyc_tag', 'created_at', 'metadata']
-        for field in required:
-            if field not in output:
-                return False, f"Missing required field: {field}"
+        # Required fields (one set comparison; name the field only on failure)
+        if not _OUTPUT_FIELD_SET <= output.keys():
+            missing = next(name for name in OUTPUT_FIELDS if name not in output)
+            return False, f"Missing required field: {missing}"
 
         # Validate asset code
         if output['asset_code'] != ASSET_CODE:
             return False, f"Invalid asset_code: {output['asset_code']}, expected {ASSET_CODE}"
 
         # Validate amount
-        if output['amount'] <= 0:
+        amount = output['amount']
+        if amount <= 0:
             return False, "Amount must be > 0"
 
-        if output['amount'] > MAX_UTXO_AMOUNT:
+        if amount > MAX_UTXO_AMOUNT:
             return False, f"Amount exceeds maximum {MAX_UTXO_AMOUNT}"
 
         # Validate status
-        if output['status'] != UTXOStatus.ACTIVE.value:
+        if output['status'] != _ACTIVE:
             return False, f"New UTXOs must have status 'active', got '{output['status']}'"
 
         # Validate KYC tag
-        try:
-            kyc_level = KYCLevel(output['kyc_tag'])
-            if kyc_level == KYCLevel.LEVEL_0:
+        kyc_tag = output['kyc_tag']
+        if kyc_tag not in KYC_VALID:
+            if kyc_tag == _KYC_L0:
                 return False, "KYC_LEVEL_0 not allowed for GENUSD"
-        except ValueError:
-            return False, f"Invalid kyc_tag: {output['kyc_tag']}"
+            return False, f"Invalid kyc_tag: {kyc_tag}"
 
         # Validate metadata
-        metadata = output['metadata']
-        if not self.policy_engine.validate_jurisdiction(metadata['jurisdiction']):
-            return False, f"Jurisdiction {metadata['jurisdiction']} not allowed"
+        jurisdiction = output['metadata']['jurisdiction']
+        if jurisdiction not in self.policy_engine.allowed_jurisdictions:
+            return False, f"Jurisdiction {jurisdiction} not allowed"
 
         return True, ""
 
+    def _create_outputs(self, tx: Transaction):
+        """Create and store one UTXO per output, with ids {tx_id}:{idx}"""
+        prefix = tx.tx_id + ":"
+        timestamp = tx.timestamp
+        for idx, out in enumerate(tx.outputs):
+            self._add_utxo(self._create_utxo(prefix + str(idx), out, timestamp))
+
     def _create_utxo(self, utxo_id: str, output: dict, timestamp: int) -> UTXO:
         """Create UTXO object from output specification"""
         metadata = UTXOMetadata(**output['metadata'])
@@ -574,12 +696,30 @@ class GENUSDEngine:
             owner_id=output['owner_id'],
             asset_code=output['asset_code'],
             amount=output['amount'],
-            status=output['status'],
+            status=_ACTIVE,  # validated; the shared constant makes status checks identity hits
             kyc_tag=output['kyc_tag'],
             created_at=timestamp,
             metadata=metadata
         )
 
+    def _add_utxo(self, utxo: UTXO):
+        """Store UTXO and index it under its owner"""
+        if utxo.status == _SPENT:
+            self.spent_archive[utxo.utxo_id] = utxo
+            return
+        self.utxos[utxo.utxo_id] = utxo
+        if utxo.status == _ACTIVE:
+            self.owner_index[utxo.owner_id][utxo.utxo_id] = utxo
+            self.balances[utxo.owner_id] += utxo.amount
+
+    def _spend_utxo(self, utxo: UTXO):
+        """Mark UTXO as spent and move it from the live set to the archive"""
+        utxo.status = _SPENT
+        del self.utxos[utxo.utxo_id]
+        self.spent_archive[utxo.utxo_id] = utxo
+        if self.owner_index[utxo.owner_id].pop(utxo.utxo_id, None) is not None:
+            self.balances[utxo.owner_id] -= utxo.amount
+
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
@@ -587,7 +727,11 @@ class GENUSDEngine:
     def export_state(self) -> dict:
         """Export entire engine state (for testing/debugging)"""
         return {
-            "utxos": {utxo_id: utxo.to_dict() for utxo_id, utxo in self.utxos.items()},
+            "utxos": {
+                utxo_id: utxo.to_dict()
+                for utxos in (self.utxos, self.spent_archive)
+                for utxo_id, utxo in utxos.items()
+            },
             "transactions": {tx_id: tx.to_dict() for tx_id, tx in self.transactions.items()},
             "total_supply": self.total_supply,
             "verified_reserves": self.verified_reserves
@@ -595,17 +739,46 @@ class GENUSDEngine:
 
     def import_state(self, state: dict):
         """Import engine state (for testing/debugging)"""
-        self.utxos = {
-            utxo_id: UTXO.from_dict(utxo_data)
-            for utxo_id, utxo_data in state.get("utxos", {}).items()
-        }
+        self._load_utxos(UTXO.from_dict(utxo_data) for utxo_data in state.get("utxos", {}).values())
         self.transactions = {
-            tx_id: Transaction(**tx_data)
+            tx_id: Transaction.from_dict(tx_data)
             for tx_id, tx_data in state.get("transactions", {}).items()
         }
         self.total_supply = state.get("total_supply", 0)
         self.verified_reserves = state.get("verified_reserves", 0)
 
+    def clone_state(self) -> dict:
+        """
+        Snapshot engine state in memory (for tests/replay).
+
+        Skips the dict round-trip of export_state. UTXOs are copied because
+        the engine mutates them; spent UTXOs and processed transactions are
+        never modified and are shared.
+        """
+        return {
+            "utxos": [utxo.copy() for utxo in self.utxos.values()]
+                     + list(self.spent_archive.values()),  # spent UTXOs are never mutated
+            "transactions": dict(self.transactions),
+            "total_supply": self.total_supply,
+            "verified_reserves": self.verified_reserves
+        }
+
+    def load_state(self, snapshot: dict):
+        """Restore a snapshot taken with clone_state (the snapshot stays reusable)"""
+        self._load_utxos(utxo.copy() for utxo in snapshot["utxos"])
+        self.transactions = dict(snapshot["transactions"])
+        self.total_supply = snapshot["total_supply"]
+        self.verified_reserves = snapshot["verified_reserves"]
+
+    def _load_utxos(self, utxos):
+        """Replace the UTXO set and rebuild owner indexes and balances"""
+        self.utxos = {}
+        self.spent_archive = {}
+        self.owner_index = defaultdict(dict)
+        self.balances = defaultdict(int)
+        for utxo in utxos:
+            self._add_utxo(utxo)
+
 
 # ============================================================================
 # MOCK CRYPTOGRAPHY (Phase 2 - Simplified)
@@ -614,12 +787,13 @@ class GENUSDEngine:
 def generate_mock_signature(signer_id: str, data: str) -> str:
     """Generate mock signature for testing"""
     combined = f"{signer_id}:{data}"
-    return f"SIG_{hashlib.sha256(combined.encode()).hexdigest()[:16]}"
+    return "SIG_" + hashlib.sha256(combined.encode()).digest()[:8].hex()
 
 
+@lru_cache(maxsize=1024)
 def generate_attestation(data: str) -> str:
-    """Generate mock issuer attestation"""
-    return f"SHA256:{hashlib.sha256(data.encode()).hexdigest()[:16]}"
+    """Generate mock issuer attestation (memoized; proofs repeat across outputs)"""
+    return "SHA256:" + hashlib.sha256(data.encode()).digest()[:8].hex()
 
 
 # ============================================================================
@@ -664,7 +838,7 @@ if __name__ == "__main__":
     }
 
     success, msg, tx_id = engine.process_transaction(mint_tx)
-    print(f"MINT: {msg}")
+    print(f"MINT: {engine.summary(tx_id) if success else msg}")
     print(f"Total supply: ${engine.get_total_supply()/100:.2f}\n")
 
     # Example 2: TRANSFER transaction
@@ -713,6 +887,6 @@ if __name__ == "__main__":
     }
 
     success, msg, tx_id = engine.process_transaction(transfer_tx)
-    print(f"TRANSFER: {msg}")
+    print(f"TRANSFER: {engine.summary(tx_id) if success else msg}")
     print(f"Merchant balance: ${engine.get_balance('x509::/C=US/ST=NY/O=Org1/CN=merchant')/100:.2f}")
     print(f"Treasury balance: ${engine.get_balance('x509::/C=US/ST=CA/O=Org1/CN=treasury')/100:.2f}\n")
@@ -8,8 +8,12 @@ Run with: python3 test_genusd_engine.py
 """
 
 import json
+import os
+import re
 import unittest
 import time
+from functools import lru_cache
+from types import MappingProxyType
 from genusd_engine import (
     GENUSDEngine,
     TransactionType,
@@ -19,28 +23,132 @@ from genusd_engine import (
     generate_attestation
 )
 
+# Each (signer, data) pair is hashed once per run; generate_attestation is
+# already memoized by the engine
+mock_signature = lru_cache(maxsize=None)(generate_mock_signature)
+
+TREASURY = "x509::/C=US/ST=CA/O=Org1/CN=treasury"
+MERCHANT = "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc"
+UK_TREASURY = "x509::/C=GB/O=Org2/CN=uk_treasury"
+
+KYC_SEED = {
+    TREASURY: "KYC_LEVEL_3",
+    MERCHANT: "KYC_LEVEL_2",
+    UK_TREASURY: "KYC_LEVEL_3",
+}
+
+# Shared JSON vectors, parsed once per run
+VECTORS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_vectors.json")
+with open(VECTORS_PATH) as f:
+    TEST_VECTORS = json.load(f)["test_vectors"]
+
+# Output metadata fields shared by every test output (read-only prototype)
+BASE_METADATA = MappingProxyType({
+    "blacklist_flag": False,
+    "freeze_reason": None,
+    "policy_version": "POLICY_V1.0",
+})
+
+
+def icase(text):
+    """Compile a case-insensitive pattern matching text literally"""
+    return re.compile(re.escape(text), re.IGNORECASE)
+
+
+# Expected error fragments, compiled once and matched with assertRegex
+RE_ISSUER_SIG = icase("issuer signature")
+RE_RESERVES = icase("reserves")
+RE_EMPTY_INPUTS = icase("empty inputs")
+RE_MISSING_FIELDS = icase("missing fields")
+RE_CONSERVATION = icase("!= output sum")
+RE_SIGNATURE = icase("signature")
+RE_KYC = icase("kyc")
+RE_EMPTY_OUTPUTS = icase("empty outputs")
+RE_NOT_ACTIVE = icase("not active")
+RE_BLACKLIST = icase("blacklist")
+
+# No test asserts on timestamps, so one clock read serves the whole run
+_NOW = int(time.time())
+
+
+def make_output(owner_id, amount, kyc_tag, attestation="test", jurisdiction="US"):
+    """Build an active GENUSD output spec"""
+    return {
+        "owner_id": owner_id,
+        "asset_code": "GENUSD",
+        "amount": amount,
+        "status": "active",
+        "kyc_tag": kyc_tag,
+        "created_at": _NOW,
+        "metadata": {
+            **BASE_METADATA,
+            "jurisdiction": jurisdiction,
+            "issuer_attestation": generate_attestation(attestation)
+        }
+    }
+
+
+def make_tx(tx_type, tx_id, inputs, outputs, signatures, **metadata):
+    """Build a transaction dict under POLICY_V1.0"""
+    return {
+        "type": tx_type,
+        "tx_id": tx_id,
+        "timestamp": _NOW,
+        "inputs": inputs,
+        "outputs": outputs,
+        "policy_ref": "POLICY_V1.0",
+        "signatures": signatures,
+        "metadata": metadata
+    }
+
+
+def mint_001_tx():
+    """MINT_20251128_001: $1,000,000 to treasury (the state most tests start from)"""
+    return make_tx(
+        "MINT", "MINT_20251128_001", [],
+        [make_output(TREASURY, 100_000_000, "KYC_LEVEL_3", "reserve_proof_1")],
+        {"issuer": mock_signature("issuer", "MINT_20251128_001")},
+        memo="Initial mint $1,000,000",
+        reserve_proof="BANK_STATEMENT_SHA256:test"
+    )
+
+
+def transfer_042_tx():
+    """TRANSFER_20251128_042: $500 of MINT_20251128_001 to the merchant, change to treasury"""
+    return make_tx(
+        "TRANSFER", "TRANSFER_20251128_042", ["MINT_20251128_001:0"],
+        [
+            make_output(MERCHANT, 50_000, "KYC_LEVEL_2", "transfer"),
+            make_output(TREASURY, 99_950_000, "KYC_LEVEL_3", "change")
+        ],
+        {TREASURY: mock_signature("treasury", "TRANSFER")},
+        memo="Payment for invoice"
+    )
+
 
 class TestGENUSDEngine(unittest.TestCase):
     """Test suite for GENUSD UTXO engine"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Process MINT_20251128_001 once; tests that start from it restore the snapshot"""
+        engine = GENUSDEngine()
+        engine.set_verified_reserves(200_000_000)
+        success, msg, _ = engine.process_transaction(mint_001_tx())
+        assert success, msg
+        cls.minted_state = engine.clone_state()
+
     def setUp(self):
         """Initialize engine before each test"""
         self.engine = GENUSDEngine()
         self.engine.set_verified_reserves(200_000_000)  # $2M reserves
 
         # Register test users
-        self.engine.policy_engine.register_kyc(
-            "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-            "KYC_LEVEL_3"
-        )
-        self.engine.policy_engine.register_kyc(
-            "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-            "KYC_LEVEL_2"
-        )
-        self.engine.policy_engine.register_kyc(
-            "x509::/C=GB/O=Org2/CN=uk_treasury",
-            "KYC_LEVEL_3"
-        )
+        self.engine.policy_engine.register_kyc_bulk(KYC_SEED)
+
+    def load_minted_state(self):
+        """Start from the state after MINT_20251128_001 without re-processing it"""
+        self.engine.load_state(self.minted_state)
 
     # ========================================================================
     # MINT TESTS
@@ -48,35 +156,7 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_mint_001_valid_single_output(self):
         """Test valid MINT with single output"""
-        tx = {
-            "type": "MINT",
-            "tx_id": "MINT_20251128_001",
-            "timestamp": int(time.time()),
-            "inputs": [],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                "asset_code": "GENUSD",
-                "amount": 100_000_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_3",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("reserve_proof_1")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "MINT_20251128_001")
-            },
-            "metadata": {
-                "memo": "Initial mint $1,000,000",
-                "reserve_proof": "BANK_STATEMENT_SHA256:test"
-            }
-        }
+        tx = mint_001_tx()
 
         success, msg, tx_id = self.engine.process_transaction(tx)
         self.assertTrue(success, msg)
@@ -86,156 +166,59 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_mint_002_valid_multiple_outputs(self):
         """Test valid MINT with multiple outputs"""
-        tx = {
-            "type": "MINT",
-            "tx_id": "MINT_20251128_002",
-            "timestamp": int(time.time()),
-            "inputs": [],
-            "outputs": [
-                {
-                    "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                    "asset_code": "GENUSD",
-                    "amount": 50_000_000,
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_3",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "US",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("reserve_1")
-                    }
-                },
-                {
-                    "owner_id": "x509::/C=GB/O=Org2/CN=uk_treasury",
-                    "asset_code": "GENUSD",
-                    "amount": 30_000_000,
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_3",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "GB",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("reserve_2")
-                    }
-                }
+        tx = make_tx(
+            "MINT", "MINT_20251128_002", [],
+            [
+                make_output(TREASURY, 50_000_000, "KYC_LEVEL_3", "reserve_1"),
+                make_output(UK_TREASURY, 30_000_000, "KYC_LEVEL_3", "reserve_2", jurisdiction="GB")
             ],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "MINT_20251128_002")
-            },
-            "metadata": {
-                "memo": "Multi-jurisdiction mint",
-                "reserve_proof": "BANK_STATEMENT_SHA256:multi"
-            }
-        }
+            {"issuer": mock_signature("issuer", "MINT_20251128_002")},
+            memo="Multi-jurisdiction mint",
+            reserve_proof="BANK_STATEMENT_SHA256:multi"
+        )
 
         success, msg, tx_id = self.engine.process_transaction(tx)
         self.assertTrue(success, msg)
         self.assertEqual(self.engine.get_total_supply(), 80_000_000)
         self.assertEqual(len(self.engine.utxos), 2)
 
-    def test_mint_invalid_001_missing_issuer_signature(self):
-        """Test MINT rejection: missing issuer signature"""
-        tx = {
-            "type": "MINT",
-            "tx_id": "MINT_INVALID_001",
-            "timestamp": int(time.time()),
-            "inputs": [],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                "asset_code": "GENUSD",
-                "amount": 100_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_3",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {},  # Missing issuer signature
-            "metadata": {"memo": "Invalid mint"}
-        }
-
-        success, msg, tx_id = self.engine.process_transaction(tx)
-        self.assertFalse(success)
-        self.assertIn("issuer signature", msg.lower())
-
-    def test_mint_invalid_002_insufficient_reserves(self):
-        """Test MINT rejection: insufficient reserves"""
-        self.engine.set_verified_reserves(1_000_000)  # Only $10k reserves
-
+    def test_mint_invalid_cases(self):
+        """Test MINT rejection: missing issuer signature, insufficient reserves, has inputs"""
+        cases = [
+            # (tx_id, inputs, amount, signed, reserves, expected error)
+            ("MINT_INVALID_001", [], 100_000, False, 200_000_000, RE_ISSUER_SIG),
+            ("MINT_INVALID_002", [], 999_999_999_999, True, 1_000_000, RE_RESERVES),  # $10B against $10k
+            ("MINT_INVALID_003", ["FAKE_UTXO:0"], 100_000, True, 200_000_000, RE_EMPTY_INPUTS),
+        ]
+
+        for tx_id, inputs, amount, signed, reserves, expected in cases:
+            with self.subTest(tx_id=tx_id):
+                self.engine.set_verified_reserves(reserves)
+                signatures = {"issuer": mock_signature("issuer", tx_id)} if signed else {}
+                tx = make_tx(
+                    "MINT", tx_id, inputs,
+                    [make_output(TREASURY, amount, "KYC_LEVEL_3")],
+                    signatures,
+                    memo="Invalid mint"
+                )
+
+                success, msg, _ = self.engine.process_transaction(tx)
+                self.assertFalse(success)
+                self.assertRegex(msg, expected)
+
+    def test_mint_invalid_004_missing_fields(self):
+        """Test transaction missing required fields is rejected"""
         tx = {
             "type": "MINT",
-            "tx_id": "MINT_INVALID_002",
-            "timestamp": int(time.time()),
+            "tx_id": "MINT_INVALID_004",
             "inputs": [],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                "asset_code": "GENUSD",
-                "amount": 999_999_999_999,  # Trying to mint $10B
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_3",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "MINT_INVALID_002")
-            },
-            "metadata": {"memo": "Exceed reserves"}
-        }
-
-        success, msg, tx_id = self.engine.process_transaction(tx)
-        self.assertFalse(success)
-        self.assertIn("reserves", msg.lower())
-
-    def test_mint_invalid_003_has_inputs(self):
-        """Test MINT rejection: has inputs (should be empty)"""
-        tx = {
-            "type": "MINT",
-            "tx_id": "MINT_INVALID_003",
-            "timestamp": int(time.time()),
-            "inputs": ["FAKE_UTXO:0"],  # MINT should have no inputs
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                "asset_code": "GENUSD",
-                "amount": 100_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_3",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "MINT_INVALID_003")
-            },
-            "metadata": {"memo": "Invalid"}
+            "outputs": []
         }
 
         success, msg, tx_id = self.engine.process_transaction(tx)
         self.assertFalse(success)
-        self.assertIn("empty inputs", msg.lower())
+        self.assertRegex(msg, RE_MISSING_FIELDS)
+        self.assertIn("timestamp", msg)
 
     # ========================================================================
     # TRANSFER TESTS
@@ -243,59 +226,15 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_transfer_001_valid_with_change(self):
         """Test valid TRANSFER with change UTXO"""
-        # First mint some tokens
-        self.test_mint_001_valid_single_output()
-
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_20251128_042",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [
-                {
-                    "owner_id": "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-                    "asset_code": "GENUSD",
-                    "amount": 50_000,
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_2",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "US",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("transfer")
-                    }
-                },
-                {
-                    "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                    "asset_code": "GENUSD",
-                    "amount": 99_950_000,
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_3",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "US",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("change")
-                    }
-                }
-            ],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "x509::/C=US/ST=CA/O=Org1/CN=treasury": generate_mock_signature("treasury", "TRANSFER")
-            },
-            "metadata": {"memo": "Payment for invoice"}
-        }
+        # Start from the minted state
+        self.load_minted_state()
 
-        success, msg, tx_id = self.engine.process_transaction(transfer_tx)
+        success, msg, tx_id = self.engine.process_transaction(transfer_042_tx())
         self.assertTrue(success, msg)
 
         # Check balances
-        merchant_balance = self.engine.get_balance("x509::/C=US/ST=NY/O=Org1/CN=merchant_abc")
-        treasury_balance = self.engine.get_balance("x509::/C=US/ST=CA/O=Org1/CN=treasury")
+        merchant_balance = self.engine.get_balance(MERCHANT)
+        treasury_balance = self.engine.get_balance(TREASURY)
         self.assertEqual(merchant_balance, 50_000)
         self.assertEqual(treasury_balance, 99_950_000)
 
@@ -303,126 +242,35 @@ class TestGENUSDEngine(unittest.TestCase):
         input_utxo = self.engine.get_utxo("MINT_20251128_001:0")
         self.assertEqual(input_utxo.status, UTXOStatus.SPENT.value)
 
-    def test_transfer_invalid_001_conservation_violation(self):
-        """Test TRANSFER rejection: input sum != output sum"""
-        # First mint
-        self.test_mint_001_valid_single_output()
-
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_INVALID_001",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [
-                {
-                    "owner_id": "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-                    "asset_code": "GENUSD",
-                    "amount": 50_000,
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_2",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "US",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("test")
-                    }
-                },
-                {
-                    "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                    "asset_code": "GENUSD",
-                    "amount": 60_000,  # Total = 110k, but input was 100M
-                    "status": "active",
-                    "kyc_tag": "KYC_LEVEL_3",
-                    "created_at": int(time.time()),
-                    "metadata": {
-                        "jurisdiction": "US",
-                        "blacklist_flag": False,
-                        "freeze_reason": None,
-                        "policy_version": "POLICY_V1.0",
-                        "issuer_attestation": generate_attestation("test")
-                    }
-                }
-            ],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "x509::/C=US/ST=CA/O=Org1/CN=treasury": generate_mock_signature("treasury", "TRANSFER")
-            },
-            "metadata": {"memo": "Invalid"}
-        }
-
-        success, msg, tx_id = self.engine.process_transaction(transfer_tx)
-        self.assertFalse(success)
-        self.assertIn("!= output sum", msg.lower())
-
-    def test_transfer_invalid_002_missing_signature(self):
-        """Test TRANSFER rejection: missing sender signature"""
-        self.test_mint_001_valid_single_output()
-
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_INVALID_002",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-                "asset_code": "GENUSD",
-                "amount": 100_000_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {},  # Missing signature
-            "metadata": {"memo": "Theft attempt"}
-        }
-
-        success, msg, tx_id = self.engine.process_transaction(transfer_tx)
-        self.assertFalse(success)
-        self.assertIn("signature", msg.lower())
-
-    def test_transfer_invalid_003_unregistered_recipient(self):
-        """Test TRANSFER rejection: recipient has no KYC"""
-        self.test_mint_001_valid_single_output()
-
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_INVALID_003",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [{
-                "owner_id": "x509::/C=XX/O=Unknown/CN=no_kyc_user",  # Not registered
-                "asset_code": "GENUSD",
-                "amount": 100_000_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "x509::/C=US/ST=CA/O=Org1/CN=treasury": generate_mock_signature("treasury", "TX")
-            },
-            "metadata": {"memo": "To unregistered user"}
-        }
-
-        success, msg, tx_id = self.engine.process_transaction(transfer_tx)
-        self.assertFalse(success)
-        self.assertIn("kyc", msg.lower())
+    def test_transfer_invalid_cases(self):
+        """Test TRANSFER rejection: conservation violation, missing signature, unregistered recipient"""
+        self.load_minted_state()
+        treasury_sig = {TREASURY: mock_signature("treasury", "TRANSFER")}
+
+        cases = [
+            # (tx_id, outputs, signatures, expected error)
+            ("TRANSFER_INVALID_001", [
+                make_output(MERCHANT, 50_000, "KYC_LEVEL_2"),
+                make_output(TREASURY, 60_000, "KYC_LEVEL_3")  # Total = 110k, but input was 100M
+            ], treasury_sig, RE_CONSERVATION),
+            ("TRANSFER_INVALID_002", [
+                make_output(MERCHANT, 100_000_000, "KYC_LEVEL_2")
+            ], {}, RE_SIGNATURE),
+            ("TRANSFER_INVALID_003", [
+                make_output("x509::/C=XX/O=Unknown/CN=no_kyc_user", 100_000_000, "KYC_LEVEL_2")  # Not registered
+            ], treasury_sig, RE_KYC),
+        ]
+
+        for tx_id, outputs, signatures, expected in cases:
+            with self.subTest(tx_id=tx_id):
+                tx = make_tx(
+                    "TRANSFER", tx_id, ["MINT_20251128_001:0"], outputs, signatures,
+                    memo="Invalid"
+                )
+
+                success, msg, _ = self.engine.process_transaction(tx)
+                self.assertFalse(success)
+                self.assertRegex(msg, expected)
 
     # ========================================================================
     # BURN TESTS
@@ -430,29 +278,26 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_burn_001_valid_redemption(self):
         """Test valid BURN transaction"""
-        # First mint
-        self.test_mint_001_valid_single_output()
-
-        burn_tx = {
-            "type": "BURN",
-            "tx_id": "BURN_20251128_099",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "BURN"),
-                "x509::/C=US/ST=CA/O=Org1/CN=treasury": generate_mock_signature("treasury", "BURN")
+        # Start from the minted state
+        self.load_minted_state()
+
+        burn_tx = make_tx(
+            "BURN", "BURN_20251128_099", ["MINT_20251128_001:0"], [],
+            {
+                "issuer": mock_signature("issuer", "BURN"),
+                TREASURY: mock_signature("treasury", "BURN")
             },
-            "metadata": {
-                "memo": "Redemption for $1M",
-                "redemption_proof": "WIRE_SHA256:test"
-            }
-        }
+            memo="Redemption for $1M",
+            redemption_proof="WIRE_SHA256:test"
+        )
 
         success, msg, tx_id = self.engine.process_transaction(burn_tx)
         self.assertTrue(success, msg)
         self.assertEqual(self.engine.get_total_supply(), 0)
+        self.assertEqual(
+            self.engine.summary(tx_id),
+            "BURN successful: 1 UTXOs burned, $1000000.00 destroyed"
+        )
 
         # Check UTXO is spent
         utxo = self.engine.get_utxo("MINT_20251128_001:0")
@@ -460,38 +305,18 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_burn_invalid_001_has_outputs(self):
         """Test BURN rejection: has outputs (should be empty)"""
-        self.test_mint_001_valid_single_output()
-
-        burn_tx = {
-            "type": "BURN",
-            "tx_id": "BURN_INVALID_001",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [{  # BURN should have no outputs
-                "owner_id": "x509::/C=US/ST=CA/O=Org1/CN=treasury",
-                "asset_code": "GENUSD",
-                "amount": 50_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_3",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "issuer": generate_mock_signature("issuer", "BURN")
-            },
-            "metadata": {"memo": "Invalid"}
-        }
+        self.load_minted_state()
+
+        burn_tx = make_tx(
+            "BURN", "BURN_INVALID_001", ["MINT_20251128_001:0"],
+            [make_output(TREASURY, 50_000, "KYC_LEVEL_3")],  # BURN should have no outputs
+            {"issuer": mock_signature("issuer", "BURN")},
+            memo="Invalid"
+        )
 
         success, msg, tx_id = self.engine.process_transaction(burn_tx)
         self.assertFalse(success)
-        self.assertIn("empty outputs", msg.lower())
+        self.assertRegex(msg, RE_EMPTY_OUTPUTS)
 
     # ========================================================================
     # ADMIN OPERATION TESTS
@@ -499,8 +324,8 @@ class TestGENUSDEngine(unittest.TestCase):
 
     def test_freeze_unfreeze_utxo(self):
         """Test freeze and unfreeze UTXO workflow"""
-        # First mint
-        self.test_mint_001_valid_single_output()
+        # Start from the minted state
+        self.load_minted_state()
         utxo_id = "MINT_20251128_001:0"
 
         # Freeze
@@ -510,38 +335,19 @@ class TestGENUSDEngine(unittest.TestCase):
         utxo = self.engine.get_utxo(utxo_id)
         self.assertEqual(utxo.status, UTXOStatus.FROZEN.value)
         self.assertEqual(utxo.metadata.freeze_reason, "AML investigation")
+        self.assertEqual(self.engine.get_balance(TREASURY), 0)
 
         # Try to spend frozen UTXO (should fail)
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_FROZEN_TEST",
-            "timestamp": int(time.time()),
-            "inputs": [utxo_id],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-                "asset_code": "GENUSD",
-                "amount": 100_000_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                "x509::/C=US/ST=CA/O=Org1/CN=treasury": generate_mock_signature("treasury", "TX")
-            },
-            "metadata": {"memo": "Try spend frozen"}
-        }
+        transfer_tx = make_tx(
+            "TRANSFER", "TRANSFER_FROZEN_TEST", [utxo_id],
+            [make_output(MERCHANT, 100_000_000, "KYC_LEVEL_2")],
+            {TREASURY: mock_signature("treasury", "TX")},
+            memo="Try spend frozen"
+        )
 
         success, msg, tx_id = self.engine.process_transaction(transfer_tx)
         self.assertFalse(success)
-        self.assertIn("not active", msg.lower())
+        self.assertRegex(msg, RE_NOT_ACTIVE)
 
         # Unfreeze
         success, msg = self.engine.unfreeze_utxo(utxo_id)
@@ -550,47 +356,140 @@ class TestGENUSDEngine(unittest.TestCase):
         utxo = self.engine.get_utxo(utxo_id)
         self.assertEqual(utxo.status, UTXOStatus.ACTIVE.value)
         self.assertIsNone(utxo.metadata.freeze_reason)
+        self.assertEqual(self.engine.get_balance(TREASURY), 100_000_000)
 
     def test_blacklist_owner(self):
         """Test blacklist functionality"""
-        # First mint
-        self.test_mint_001_valid_single_output()
+        # Start from the minted state
+        self.load_minted_state()
 
         # Blacklist the owner
-        owner_id = "x509::/C=US/ST=CA/O=Org1/CN=treasury"
+        owner_id = TREASURY
         self.engine.policy_engine.blacklist_owner(owner_id)
 
         # Try to transfer (should fail)
-        transfer_tx = {
-            "type": "TRANSFER",
-            "tx_id": "TRANSFER_BLACKLIST_TEST",
-            "timestamp": int(time.time()),
-            "inputs": ["MINT_20251128_001:0"],
-            "outputs": [{
-                "owner_id": "x509::/C=US/ST=NY/O=Org1/CN=merchant_abc",
-                "asset_code": "GENUSD",
-                "amount": 100_000_000,
-                "status": "active",
-                "kyc_tag": "KYC_LEVEL_2",
-                "created_at": int(time.time()),
-                "metadata": {
-                    "jurisdiction": "US",
-                    "blacklist_flag": False,
-                    "freeze_reason": None,
-                    "policy_version": "POLICY_V1.0",
-                    "issuer_attestation": generate_attestation("test")
-                }
-            }],
-            "policy_ref": "POLICY_V1.0",
-            "signatures": {
-                owner_id: generate_mock_signature("treasury", "TX")
-            },
-            "metadata": {"memo": "Blacklisted transfer"}
-        }
+        transfer_tx = make_tx(
+            "TRANSFER", "TRANSFER_BLACKLIST_TEST", ["MINT_20251128_001:0"],
+            [make_output(MERCHANT, 100_000_000, "KYC_LEVEL_2")],
+            {owner_id: mock_signature("treasury", "TX")},
+            memo="Blacklisted transfer"
+        )
 
         success, msg, tx_id = self.engine.process_transaction(transfer_tx)
         self.assertFalse(success)
-        self.assertIn("blacklist", msg.lower())
+        self.assertRegex(msg, RE_BLACKLIST)
+
+    # ========================================================================
+    # TEST VECTOR TESTS
+    # ========================================================================
+
+    def mint_seed(self, tx_id, owner_id, kyc_tag, amount):
+        """Mint the single UTXO <tx_id>:0 that a test vector refers to"""
+        tx = make_tx(
+            "MINT", tx_id, [],
+            [make_output(owner_id, amount, kyc_tag)],
+            {"issuer": mock_signature("issuer", tx_id)},
+            memo="Test vector seed"
+        )
+        success, msg, _ = self.engine.process_transaction(tx)
+        self.assertTrue(success, msg)
+        return f"{tx_id}:0"
+
+    def seed_vector_inputs(self, name):
+        """Create the UTXOs an invalid vector spends, in the state it expects"""
+        if name == "transfer_invalid_002":
+            # Frozen UTXO
+            utxo_id = self.mint_seed("FROZEN_UTXO_123", TREASURY, "KYC_LEVEL_3", 50_000)
+            success, msg = self.engine.freeze_utxo(utxo_id, "AML investigation")
+            self.assertTrue(success, msg)
+        elif name == "transfer_invalid_004":
+            # Already-spent UTXO
+            utxo_id = self.mint_seed("TRANSFER_20251128_001", MERCHANT, "KYC_LEVEL_2", 50_000)
+            spend_tx = make_tx(
+                "TRANSFER", "TRANSFER_SEED_SPEND", [utxo_id],
+                [make_output(TREASURY, 50_000, "KYC_LEVEL_3")],
+                {MERCHANT: mock_signature("merchant_abc", "TRANSFER")},
+                memo="Spend before the double-spend attempt"
+            )
+            success, msg, _ = self.engine.process_transaction(spend_tx)
+            self.assertTrue(success, msg)
+        elif name == "burn_invalid_001":
+            # $500 UTXO, below the $1,000 minimum burn
+            self.mint_seed("SMALL_UTXO", TREASURY, "KYC_LEVEL_3", 50_000)
+
+    def test_invalid_vectors_rejected(self):
+        """Test every invalid vector in test_vectors.json fails with its expected error"""
+        for name, vector in TEST_VECTORS["invalid_transactions"].items():
+            with self.subTest(vector=name):
+                self.load_minted_state()
+                self.seed_vector_inputs(name)
+
+                success, msg, tx_id = self.engine.process_transaction(vector["transaction"])
+                self.assertFalse(success)
+                self.assertRegex(msg, icase(vector["expected_error"]))
+
+    # ========================================================================
+    # STATE TESTS
+    # ========================================================================
+
+    def test_import_state_rebuilds_owner_index(self):
+        """Test balances and owner UTXOs survive an export/import round-trip"""
+        self.load_minted_state()
+        success, msg, _ = self.engine.process_transaction(transfer_042_tx())
+        self.assertTrue(success, msg)
+        state = json.loads(json.dumps(self.engine.export_state()))
+
+        restored = GENUSDEngine()
+        restored.import_state(state)
+
+        for owner_id in (TREASURY, MERCHANT):
+            self.assertEqual(restored.get_balance(owner_id), self.engine.get_balance(owner_id))
+            self.assertEqual(
+                [u.utxo_id for u in restored.get_owner_utxos(owner_id)],
+                [u.utxo_id for u in self.engine.get_owner_utxos(owner_id)],
+            )
+
+    def test_clone_and_load_state(self):
+        """Test in-memory snapshot is isolated from later mutations"""
+        self.load_minted_state()
+        owner_id = TREASURY
+        utxo_id = "MINT_20251128_001:0"
+        snapshot = self.engine.clone_state()
+
+        self.engine.freeze_utxo(utxo_id, "AML investigation")
+        self.assertEqual(self.engine.get_balance(owner_id), 0)
+
+        self.engine.load_state(snapshot)
+        utxo = self.engine.get_utxo(utxo_id)
+        self.assertEqual(utxo.status, UTXOStatus.ACTIVE.value)
+        self.assertIsNone(utxo.metadata.freeze_reason)
+        self.assertEqual(self.engine.get_balance(owner_id), 100_000_000)
+        self.assertEqual(self.engine.get_total_supply(), 100_000_000)
+
+    def test_process_batch_stops_on_error(self):
+        """Test batch processing runs in order and can stop at first failure"""
+        def mint(tx_id, signatures):
+            return make_tx(
+                "MINT", tx_id, [],
+                [make_output(TREASURY, 100_000, "KYC_LEVEL_3", "batch")],
+                signatures,
+                memo="Batch mint"
+            )
+
+        issuer_sig = {"issuer": mock_signature("issuer", "BATCH")}
+        batch = [
+            mint("MINT_BATCH_001", issuer_sig),
+            mint("MINT_BATCH_002", {}),  # Missing issuer signature
+            mint("MINT_BATCH_003", issuer_sig),
+        ]
+
+        results = self.engine.process_batch(batch, stop_on_error=True)
+        self.assertEqual([r[0] for r in results], [True, False])
+        self.assertEqual(self.engine.get_total_supply(), 100_000)
+
+        results = self.engine.process_batch(batch[2:])
+        self.assertTrue(results[0][0], results[0][1])
+        self.assertEqual(self.engine.get_total_supply(), 200_000)
 
 
 # ============================================================================
@@ -8,73 +8,231 @@ This demonstrates a CBDC-style payment system with:
 - Performance metrics
 """
 
+import os
+import select
+import shlex
 import subprocess
+import threading
 import json
 import time
 import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _json_loads(text: str):
+    """Decode a JSON payload from peer output"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class StablecoinSimulator:
     def __init__(self):
         self.test_network_path = "/home/rsolipuram/stablecoin-fabric/fabric-samples/test-network"
+        # Peer environment, built once and handed to each shell directly
+        self.env = {
+            **os.environ,
+            'PATH': f"{self.test_network_path}/../bin{os.pathsep}{os.environ.get('PATH', '')}",
+            'FABRIC_CFG_PATH': f"{self.test_network_path}/../config/",
+            'CORE_PEER_TLS_ENABLED': "true",
+            'CORE_PEER_LOCALMSPID': "Org1MSP",
+            'CORE_PEER_TLS_ROOTCERT_FILE': f"{self.test_network_path}/organizations/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt",
+            'CORE_PEER_MSPCONFIGPATH': f"{self.test_network_path}/organizations/peerOrganizations/org1.example.com/users/Admin@org1.example.com/msp",
+            'CORE_PEER_ADDRESS': "localhost:7051",
+        }
+        # Fixed part of every chaincode command, built once; calls only
+        # append the quoted '-c' payload. Invokes wait for their commit
+        # event (and give up before _exec's 30s timeout) so a returned
+        # transfer is already visible to the next one on the same account
+        orgs = f"{self.test_network_path}/organizations"
+        self._query_prefix = "peer chaincode query -C mychannel -n stablecoin -c "
+        self._invoke_prefix = shlex.join([
+            'peer', 'chaincode', 'invoke',
+            '-o', 'localhost:7050',
+            '--ordererTLSHostnameOverride', 'orderer.example.com',
+            '--tls',
+            '--cafile', f"{orgs}/ordererOrganizations/example.com/orderers/orderer.example.com/msp/tlscacerts/tlsca.example.com-cert.pem",
+            '-C', 'mychannel',
+            '-n', 'stablecoin',
+            '--peerAddresses', 'localhost:7051',
+            '--tlsRootCertFiles', f"{orgs}/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt",
+            '--peerAddresses', 'localhost:9051',
+            '--tlsRootCertFiles', f"{orgs}/peerOrganizations/org2.example.com/peers/peer0.org2.example.com/tls/ca.crt",
+            '--waitForEvent',
+            '--waitForEventTimeout', '25s',
+            '-c',
+        ]) + " "
+        # Marks the end of each command's output on a shell
+        self._sentinel = f"__STABLECOIN_SIM_DONE_{os.getpid()}__"
+        # One shell per thread so concurrent queries never share a pipe
+        self._local = threading.local()
+        self._shells = []
+        self._shells_lock = threading.Lock()
+    
+    def _start_shell(self) -> subprocess.Popen:
+        """Spawn a long-lived bash that inherits the peer environment"""
+        shell = subprocess.Popen(
+            ['bash'],
+            cwd=self.test_network_path,
+            env=self.env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        with self._shells_lock:
+            self._shells.append(shell)
+        return shell
+    
+    def _discard_shell(self, shell: subprocess.Popen):
+        """Kill one shell and forget it"""
+        shell.kill()
+        shell.wait()
+        with self._shells_lock:
+            if shell in self._shells:
+                self._shells.remove(shell)
+    
+    def close(self):
+        """Terminate every persistent shell (new ones start on the next command)"""
+        with self._shells_lock:
+            shells, self._shells = self._shells, []
+        for shell in shells:
+            shell.kill()
+            shell.wait()
+    
+    def _exec(self, command: str, timeout: float = 30):
+        """Run one command on the persistent shell, returning (returncode, output)"""
+        shell = getattr(self._local, 'shell', None)
+        if shell is None or shell.poll() is not None:
+            shell = self._local.shell = self._start_shell()
+        marker = f"\n{self._sentinel} ".encode()
+        
+        # stdin is the shell's command pipe; a command reading it would eat
+        # the commands queued behind it
+        shell.stdin.write(f"{{ {command}\n}} </dev/null\nprintf '\\n%s %d\\n' {self._sentinel} $?\n".encode())
+        shell.stdin.flush()
+        
+        fd = shell.stdout.fileno()
+        out = bytearray()
+        idx = -1  # Position of the marker once seen
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                self._discard_shell(shell)
+                raise TimeoutError(f"Command timed out after {timeout} seconds")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self._discard_shell(shell)
+                raise RuntimeError("Peer shell exited unexpectedly")
+            out += chunk
+            if idx < 0:
+                # The marker may straddle the previous read
+                idx = out.find(marker, max(0, len(out) - len(chunk) - len(marker)))
+            if idx >= 0 and out.endswith(b"\n"):
+                returncode = int(out[idx + len(marker):].split()[0])
+                return returncode, out[:idx].decode(errors='replace')
     
     def _run_cmd(self, command: str) -> dict:
         """Run peer command and return result"""
-        env_vars = f"""
-export PATH={self.test_network_path}/../bin:$PATH
-export FABRIC_CFG_PATH={self.test_network_path}/../config/
-export CORE_PEER_TLS_ENABLED=true
-export CORE_PEER_LOCALMSPID="Org1MSP"
-export CORE_PEER_TLS_ROOTCERT_FILE={self.test_network_path}/organizations/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt
-export CORE_PEER_MSPCONFIGPATH={self.test_network_path}/organizations/peerOrganizations/org1.example.com/users/Admin@org1.example.com/msp
-export CORE_PEER_ADDRESS=localhost:7051
-"""
-        full_cmd = f"cd {self.test_network_path} && {env_vars} && {command}"
         start = time.time()
         
         try:
-            result = subprocess.run(['bash', '-c', full_cmd], capture_output=True, text=True, timeout=30)
+            returncode, output = self._exec(command)
             duration_ms = (time.time() - start) * 1000
             
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                for line in output.split('\n'):
-                    if line.strip().startswith('{'):
-                        try:
-                            return {'success': True, 'data': json.loads(line.strip()), 'duration_ms': duration_ms}
-                        except:
-                            pass
+            if returncode == 0:
+                output = output.strip()
+                # The JSON payload is the last line starting with '{'
+                last = output.rfind('\n{')
+                idx = last + 1 if last >= 0 else (0 if output.startswith('{') else -1)
+                if idx >= 0:
+                    end = output.find('\n', idx)
+                    try:
+                        data = _json_loads(output[idx:end if end >= 0 else None])
+                        return {'success': True, 'data': data, 'duration_ms': duration_ms}
+                    except ValueError:
+                        pass
                 return {'success': True, 'output': output, 'duration_ms': duration_ms}
             else:
-                return {'success': False, 'error': result.stderr[:200], 'duration_ms': duration_ms}
+                return {'success': False, 'error': output.strip()[:200], 'duration_ms': duration_ms}
         except Exception as e:
             return {'success': False, 'error': str(e)[:200]}
     
+    @staticmethod
+    def _ctor(function: str, *args) -> str:
+        """Shell-quoted chaincode '-c' payload"""
+        return shlex.quote(json.dumps({"function": function, "Args": [str(a) for a in args]}, separators=(',', ':')))
+    
     def balance(self, account: str) -> float:
         """Get account balance"""
-        cmd = f"peer chaincode query -C mychannel -n stablecoin -c '{{\"function\":\"BalanceOf\",\"Args\":[\"{account}\"]}}'"
-        result = self._run_cmd(cmd)
+        result = self._run_cmd(self._query_prefix + self._ctor("BalanceOf", account))
         if result.get('success') and result.get('data'):
             return result['data'].get('balance', 0)
         return 0
     
     def total_supply(self) -> float:
         """Get total supply"""
-        cmd = "peer chaincode query -C mychannel -n stablecoin -c '{\"function\":\"TotalSupply\",\"Args\":[]}'"
-        result = self._run_cmd(cmd)
+        result = self._run_cmd(self._query_prefix + self._ctor("TotalSupply"))
         if result.get('success') and result.get('data'):
             return result['data'].get('totalSupply', 0)
         return 0
     
     def transfer(self, from_acc: str, to_acc: str, amount: int) -> dict:
         """Transfer tokens"""
-        cmd = f"""peer chaincode invoke -o localhost:7050 --ordererTLSHostnameOverride orderer.example.com --tls --cafile {self.test_network_path}/organizations/ordererOrganizations/example.com/orderers/orderer.example.com/msp/tlscacerts/tlsca.example.com-cert.pem -C mychannel -n stablecoin --peerAddresses localhost:7051 --tlsRootCertFiles {self.test_network_path}/organizations/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt --peerAddresses localhost:9051 --tlsRootCertFiles {self.test_network_path}/organizations/peerOrganizations/org2.example.com/peers/peer0.org2.example.com/tls/ca.crt -c '{{\"function\":\"Transfer\",\"Args\":[\"{from_acc}\",\"{to_acc}\",\"{amount}\"]}}'"""
-        return self._run_cmd(cmd)
+        return self._run_cmd(self._invoke_prefix + self._ctor("Transfer", from_acc, to_acc, amount))
     
     def mint(self, account: str, amount: int) -> dict:
         """Mint tokens"""
-        cmd = f"""peer chaincode invoke -o localhost:7050 --ordererTLSHostnameOverride orderer.example.com --tls --cafile {self.test_network_path}/organizations/ordererOrganizations/example.com/orderers/orderer.example.com/msp/tlscacerts/tlsca.example.com-cert.pem -C mychannel -n stablecoin --peerAddresses localhost:7051 --tlsRootCertFiles {self.test_network_path}/organizations/peerOrganizations/org1.example.com/peers/peer0.org1.example.com/tls/ca.crt --peerAddresses localhost:9051 --tlsRootCertFiles {self.test_network_path}/organizations/peerOrganizations/org2.example.com/peers/peer0.org2.example.com/tls/ca.crt -c '{{\"function\":\"Mint\",\"Args\":[\"{account}\",\"{amount}\"]}}'"""
-        return self._run_cmd(cmd)
+        return self._run_cmd(self._invoke_prefix + self._ctor("Mint", account, amount))
+
+
+def run_disjoint(executor: ThreadPoolExecutor, transfer, payments, window: int):
+    """
+    Submit (sender, receiver, amount) payments with at most ``window`` in
+    flight, yielding each result as it completes
+
+    Transfer writes both the sender and receiver accounts, and concurrent
+    invokes writing one key fail MVCC validation at commit, so a payment is
+    only submitted once no in-flight invoke touches either of its accounts.
+    An account is released when ``transfer`` returns, which must therefore
+    be after the commit (the simulator's invokes use --waitForEvent).
+    Payments that share an account still run in their original order.
+    """
+    pending = list(payments)
+    busy = set()
+    in_flight = {}
+    while pending or in_flight:
+        waiting = []
+        claimed = set()  # Accounts of earlier payments that are still waiting
+        for payment in pending:
+            accounts = payment[:2]
+            if len(in_flight) < window and busy.isdisjoint(accounts) and claimed.isdisjoint(accounts):
+                busy.update(accounts)
+                in_flight[executor.submit(transfer, *payment)] = payment
+            else:
+                claimed.update(accounts)
+                waiting.append(payment)
+        pending = waiting
+        
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            busy.difference_update(in_flight.pop(future)[:2])
+            yield future.result()
+
+
+# Configuration
+NUM_BANKS = 3
+NUM_USERS = 8
+NUM_TRANSACTIONS = 30
+MAX_WORKERS = 16  # Concurrent peer queries
+MAX_INFLIGHT_TX = 8  # Concurrent payment invokes
+PAYMENT_SEED = None  # Set an int to replay the same Phase-4 payments
 
 
 def main():
@@ -85,12 +243,20 @@ def main():
     print("="*80 + "\n")
     
     sim = StablecoinSimulator()
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        run_phases(sim, executor)
+    finally:
+        executor.shutdown()
+        sim.close()
     
-    # Configuration
-    NUM_BANKS = 3
-    NUM_USERS = 8
-    NUM_TRANSACTIONS = 30
-    
+    print("\n" + "="*80)
+    print("✓ Simulation completed successfully!")
+    print("="*80 + "\n")
+
+
+def run_phases(sim: StablecoinSimulator, executor: ThreadPoolExecutor):
+    """Run the four simulation phases and print the results"""
     banks = [f"cbdc_bank_{i+1}" for i in range(NUM_BANKS)]
     users = [f"cbdc_user_{i+1}" for i in range(NUM_USERS)]
     
@@ -126,8 +292,13 @@ def main():
     
     bank_allocation = 50000  # Each bank gets 50k tokens
     
+    # Balance reads run concurrently; the transfers all debit central_bank,
+    # so they stay serial (each waits for its commit) to avoid MVCC read
+    # conflicts on that key
+    bank_balances = dict(zip(banks, executor.map(sim.balance, banks)))
+    
     for bank in banks:
-        current = sim.balance(bank)
+        current = bank_balances[bank]
         if current < 10000:
             print(f"Funding {bank} with {bank_allocation:,} tokens...")
             result = sim.transfer("central_bank", bank, bank_allocation)
@@ -143,19 +314,35 @@ def main():
     print("Phase 3: Distribute to Retail Users")
     print("-" * 80)
     
+    user_balances = dict(zip(users, executor.map(sim.balance, users)))
+    
     funded_users = 0
+    grants_by_bank = {}
     for user in users:
-        current = sim.balance(user)
-        if current < 50:
+        if user_balances[user] < 50:
             bank = random.choice(banks)
             amount = random.randint(500, 1500)
-            result = sim.transfer(bank, user, amount)
+            grants_by_bank.setdefault(bank, []).append((user, amount))
+        else:
+            funded_users += 1
+    
+    def fund_from(bank, grants):
+        """
+        Send one bank's grants serially (they all debit the same key)
+        
+        Each invoke returns only once committed (--waitForEvent), so the
+        next grant is endorsed against the bank's updated balance.
+        """
+        return [sim.transfer(bank, user, amount) for user, amount in grants]
+    
+    # Different sender banks touch disjoint keys, so their batches run in parallel
+    futures = [executor.submit(fund_from, bank, grants) for bank, grants in grants_by_bank.items()]
+    for future in as_completed(futures):
+        for result in future.result():
             if result.get('success'):
                 funded_users += 1
                 if funded_users % 3 == 0:
                     print(f"  Progress: {funded_users}/{NUM_USERS} users funded")
-        else:
-            funded_users += 1
     
     print(f"✓ {funded_users}/{NUM_USERS} users have sufficient balance\n")
     
@@ -165,27 +352,37 @@ def main():
     print("-" * 80)
     print(f"Executing {NUM_TRANSACTIONS} retail payment transactions...\n")
     
+    # Draw every payment up front: a receiver offset in 1..NUM_USERS-1
+    # from the sender always lands on a different user
+    rng = random.Random(PAYMENT_SEED)
+    senders = rng.choices(range(NUM_USERS), k=NUM_TRANSACTIONS)
+    offsets = rng.choices(range(1, NUM_USERS), k=NUM_TRANSACTIONS)
+    amounts = rng.choices(range(10, 101), k=NUM_TRANSACTIONS)
+    payments = [
+        (users[si], users[(si + off) % NUM_USERS], amount)
+        for si, off, amount in zip(senders, offsets, amounts)
+    ]
+    
     successful = 0
     failed = 0
     durations = []
     start_time = time.time()
     
-    for i in range(NUM_TRANSACTIONS):
-        sender = random.choice(users)
-        receiver = random.choice([u for u in users if u != sender])
-        amount = random.randint(10, 100)
+    # Keep a bounded window of invokes in flight instead of waiting out
+    # each endorsement + ordering round-trip before sending the next
+    with ThreadPoolExecutor(max_workers=MAX_INFLIGHT_TX) as tx_executor:
+        results = run_disjoint(tx_executor, sim.transfer, payments, MAX_INFLIGHT_TX)
         
-        result = sim.transfer(sender, receiver, amount)
-        
-        if result.get('success'):
-            successful += 1
-            if result.get('duration_ms'):
-                durations.append(result['duration_ms'])
-        else:
-            failed += 1
-        
-        if (i + 1) % 10 == 0:
-            print(f"  Progress: {i+1}/{NUM_TRANSACTIONS} ({successful} successful, {failed} failed)")
+        for i, result in enumerate(results):
+            if result.get('success'):
+                successful += 1
+                if result.get('duration_ms'):
+                    durations.append(result['duration_ms'])
+            else:
+                failed += 1
+            
+            if (i + 1) % 10 == 0:
+                print(f"  Progress: {i+1}/{NUM_TRANSACTIONS} ({successful} successful, {failed} failed)")
     
     total_time = time.time() - start_time
     
@@ -211,14 +408,21 @@ def main():
     
     print("💰 Final Account Balances:\n")
     
-    cb_final = sim.balance("central_bank")
+    # Prefetch every final balance and the total supply in one concurrent
+    # batch; the report below only reads from it
+    accounts = ["central_bank"] + banks + users
+    supply_future = executor.submit(sim.total_supply)
+    balances = dict(zip(accounts, executor.map(sim.balance, accounts)))
+    total_supply = supply_future.result()
+    
+    cb_final = balances["central_bank"]
     print(f"  Central Bank:")
     print(f"    central_bank:          {cb_final:>12,.0f}\n")
     
     print(f"  Commercial Banks:")
     total_bank = 0
     for bank in banks:
-        bal = sim.balance(bank)
+        bal = balances[bank]
         total_bank += bal
         print(f"    {bank:20s} {bal:>12,.0f}")
     print(f"    {'Total:':<20s} {total_bank:>12,.0f}\n")
@@ -226,17 +430,16 @@ def main():
     print(f"  Retail Users (sample):")
     total_users = 0
     for user in users[:5]:
-        bal = sim.balance(user)
+        bal = balances[user]
         total_users += bal
         print(f"    {user:20s} {bal:>12,.0f}")
     
     for user in users[5:]:
-        total_users += sim.balance(user)
+        total_users += balances[user]
     
     print(f"    ... ({NUM_USERS-5} more users)")
     print(f"    {'Total all users:':<20s} {total_users:>12,.0f}\n")
     
-    total_supply = sim.total_supply()
     print("🪙 Supply & Conservation:")
     print(f"  Total Supply:            {total_supply:>12,.0f}")
     print(f"  Central Bank:            {cb_final:>12,.0f}")
@@ -250,10 +453,6 @@ def main():
     else:
         diff = abs(calculated - total_supply)
         print(f"\n  ⚠ Difference: {diff:,.0f} (some tokens in other accounts)")
-    
-    print("\n" + "="*80)
-    print("✓ Simulation completed successfully!")
-    print("="*80 + "\n")
 
 
 if __name__ == "__main__":